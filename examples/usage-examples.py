@@ -123,13 +123,13 @@ updater.schedule_updates()
 custom_instrument_example = '''
 import asyncio
 from futures_data_manager import FuturesDataManager
-from futures_data_manager.config.instruments import InstrumentConfig, InstrumentInfo, AssetClass, Region
+from futures_data_manager.config.instruments import get_default_config, InstrumentInfo, AssetClass, Region
 
 async def add_custom_instrument():
     manager = FuturesDataManager(data_path="./data")
     
-    # Add custom instrument configuration
-    config = InstrumentConfig()
+    # Add custom instrument configuration (shared with the manager)
+    config = get_default_config()
     
     # Example: Adding Bitcoin futures (if not already configured)
     custom_instrument = InstrumentInfo(
@@ -146,8 +146,8 @@ async def add_custom_instrument():
         roll_offset_days=-5
     )
     
-    # Manually add to configuration (in production, you'd modify the config class)
-    config._instruments["BITCOIN_CUSTOM"] = custom_instrument
+    # Register with the configuration (in production, you'd add it to the CSV files)
+    config.add_instrument(custom_instrument)
     
     # Download data for custom instrument
     await manager.add_new_instrument(
@@ -6,6 +6,7 @@ Configuration module for Futures Data Manager
 from futures_data_manager.config.instruments import (
     InstrumentConfig,
     InstrumentInfo, 
+    get_default_config,
     AssetClass,
     Region,
     MAJOR_EQUITY_INDICES,
@@ -19,6 +20,7 @@ from futures_data_manager.config.instruments import (
 __all__ = [
     "InstrumentConfig",
     "InstrumentInfo",
+    "get_default_config",
     "AssetClass", 
     "Region",
     "MAJOR_EQUITY_INDICES",
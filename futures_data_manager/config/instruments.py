@@ -3,16 +3,40 @@ Instrument configuration module containing all futures instruments supported by
 Reads configuration from CSV files for maintainability and comprehensive coverage.
 """
 
-import csv
+import functools
+import hashlib
 import os
+import pickle
+import sys
+from collections import defaultdict
+from itertools import compress, repeat
+from operator import contains
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Set
-from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Any, ClassVar, FrozenSet, Optional, List, Mapping, Set, Tuple
 from enum import Enum
 
+from loguru import logger
 
-class AssetClass(Enum):
-    """Asset class enumeration."""
+from futures_data_manager.utils.dataclass_utils import slotted_dataclass
+
+
+# Roll cycles shared by the defaults below
+_HOLD_FINANCIAL = "HMUZ"
+_HOLD_MONTHLY = "FGHJKMNQUVXZ"
+_HOLD_METALS = "GJMQVZ"
+_HOLD_AGS = "HKNUZ"
+
+
+class AssetClass(str, Enum):
+    """
+    Asset class enumeration.
+    
+    Mixing in str makes hashing and equality use the C string implementation
+    instead of Enum's Python-level __hash__, which matters for the index and
+    cache lookups keyed by asset class. Members also compare equal to their
+    CSV value, e.g. AssetClass.EQUITY == "Equity".
+    """
     EQUITY = "Equity"
     BOND = "Bond"
     FX = "FX"
@@ -29,16 +53,20 @@ class AssetClass(Enum):
     COMMODITY_INDEX = "CommodityIndex"
 
 
-class Region(Enum):
-    """Regional enumeration."""
+class Region(str, Enum):
+    """Regional enumeration (str mixin for the same reasons as AssetClass)."""
     US = "US"
     EMEA = "EMEA"
     ASIA = "ASIA"
 
 
-@dataclass
+@slotted_dataclass(frozen=True)
 class InstrumentInfo:
-    """Container for instrument configuration data."""
+    """
+    Container for instrument configuration data.
+    
+    Instances are immutable; use dataclasses.replace() to derive a modified copy.
+    """
     instrument_code: str
     description: str
     pointsize: float
@@ -57,8 +85,8 @@ class InstrumentInfo:
     duration: Optional[str] = None
     
     # Roll parameters
-    hold_cycle: str = "HMUZ"
-    priced_cycle: str = "HMUZ"
+    hold_cycle: str = _HOLD_FINANCIAL
+    priced_cycle: str = _HOLD_FINANCIAL
     roll_offset_days: int = -5
     expiry_offset: int = 0
     carry_offset: int = -1
@@ -68,14 +96,192 @@ class InstrumentInfo:
     ib_exchange: Optional[str] = None
     ib_currency: Optional[str] = None
     ib_multiplier: Optional[int] = None
+    
+    def as_ib_specs(self) -> Dict[str, Any]:
+        """Return the Interactive Brokers contract specification dictionary."""
+        return {
+            "symbol": self.ib_symbol,
+            "exchange": self.ib_exchange,
+            "currency": self.ib_currency,
+            "multiplier": self.ib_multiplier or self.pointsize,
+            "secType": "FUT"
+        }
+
+
+def _compile_dict_builder(name: str, keys: Tuple[str, ...], doc: str):
+    """
+    Generate a method returning a dict of InstrumentInfo fields.
+    
+    The body is a single dict display with the keys baked in as constants, so
+    CPython builds it with one BUILD_CONST_KEY_MAP. Enum fields are emitted
+    as their string values.
+    
+    Args:
+        name: Method name
+        keys: Field names in output order
+        doc: Docstring for the generated method
+        
+    Returns:
+        Function taking an InstrumentInfo
+    """
+    entries = ", ".join(
+        f"{key!r}: self.{key}.value" if key in _ENUM_FIELDS else f"{key!r}: self.{key}"
+        for key in keys
+    )
+    namespace = {}
+    exec(f"def {name}(self):\n    return {{{entries}}}\n", namespace)
+    
+    method = namespace[name]
+    method.__qualname__ = f"InstrumentInfo.{name}"
+    method.__doc__ = doc
+    return method
+
+
+_ENUM_FIELDS = frozenset({"asset_class", "region"})
+
+_ROLL_CONFIG_FIELDS = (
+    "hold_cycle", "priced_cycle", "roll_offset_days", "expiry_offset", "carry_offset"
+)
+_ADDITIONAL_INFO_FIELDS = ("subclass", "sub_subclass", "style", "country", "duration")
+_CONFIG_FIELDS = (
+    ("instrument_code", "description", "pointsize", "currency", "asset_class", "region",
+     "per_block", "percentage", "per_trade")
+    + _ROLL_CONFIG_FIELDS
+    + _ADDITIONAL_INFO_FIELDS
+    + ("ib_symbol", "ib_exchange", "ib_currency", "ib_multiplier")
+)
+
+InstrumentInfo.as_config_dict = _compile_dict_builder(
+    "as_config_dict", _CONFIG_FIELDS,
+    "Return every field as a plain dictionary, with enums as their string values."
+)
+InstrumentInfo.as_roll_config = _compile_dict_builder(
+    "as_roll_config", _ROLL_CONFIG_FIELDS, "Return the roll parameters as a dictionary."
+)
+InstrumentInfo.as_additional_info = _compile_dict_builder(
+    "as_additional_info", _ADDITIONAL_INFO_FIELDS,
+    "Return the additional classification fields as a dictionary."
+)
+
+
+def _parse_numeric_columns(frame, label: str, columns: Dict[str, Optional[float]], integer: bool = False):
+    """
+    Convert text columns of a configuration frame to numbers in bulk.
+    
+    Rows with a value that does not parse are dropped and reported together
+    in a single warning.
+    
+    Args:
+        frame: DataFrame read with dtype=str, including an 'Instrument' column
+        label: Description used in warning messages
+        columns: Column name -> value used for blank cells (None: blank is invalid)
+        integer: Require integral values and return Python ints
+        
+    Returns:
+        Tuple of (frame restricted to valid rows, column name -> list of values)
+    """
+    import pandas as pd
+    
+    valid = pd.Series(True, index=frame.index)
+    parsed = {}
+    rejected = []
+    for column, blank_value in columns.items():
+        raw = frame[column]
+        values = pd.to_numeric(raw, errors='coerce')
+        if blank_value is not None:
+            values = values.mask(raw.str.strip() == '', blank_value)
+        
+        invalid = values.isna()
+        if integer:
+            invalid |= values != values.round()
+        
+        newly_invalid = invalid & valid
+        if newly_invalid.any():
+            rejected.extend(
+                f"{code} ({column}={value!r})"
+                for code, value in zip(frame['Instrument'][newly_invalid], raw[newly_invalid])
+            )
+        
+        valid &= ~invalid
+        parsed[column] = values
+    
+    if rejected:
+        logger.warning(f"Error parsing {label}: skipped {len(rejected)} rows with invalid values: "
+                       f"{', '.join(rejected)}")
+    
+    numbers = {
+        column: (values[valid].astype('int64') if integer else values[valid].astype('float64')).tolist()
+        for column, values in parsed.items()
+    }
+    return frame[valid], numbers
 
 
 class InstrumentConfig:
     """
     Comprehensive instrument configuration for all futures markets.
     Reads configuration from CSV files for maintainability and comprehensive coverage.
+    
+    The CSV files are read on first access to the instrument database, so
+    constructing an InstrumentConfig is cheap.
     """
     
+    # Configuration files: (filename, required, frame preparer, label)
+    _CSV_SOURCES = (
+        ("instrumentconfig.csv", True, "_prepare_instrument_frame", "instrument configuration"),
+        ("rollconfig.csv", False, "_prepare_roll_frame", "roll configuration"),
+        ("moreinstrumentinfo.csv", False, "_prepare_additional_info_frame", "additional instrument info"),
+    )
+    
+    # InstrumentInfo field -> moreinstrumentinfo.csv column
+    _ADDITIONAL_INFO_COLUMNS = {
+        'subclass': 'SubClass',
+        'sub_subclass': 'SubSubClass',
+        'style': 'Style',
+        'country': 'Country',
+        'duration': 'Duration'
+    }
+    
+    # Prebuilt database shipped next to the packaged CSV files; regenerate
+    # with ``make regen-instruments``. It is only read from the package's own
+    # config directory, never from a user-supplied config_dir.
+    _SNAPSHOT_FILE = "instruments.pkl"
+    _PACKAGE_CONFIG_DIR = Path(__file__).resolve().parent
+    
+    # First line of the snapshot, checked before anything is unpickled
+    _SNAPSHOT_MAGIC = b"futures_data_manager-instruments"
+    
+    # Bumped whenever the layout of the snapshot changes
+    _SNAPSHOT_FORMAT = 3
+    
+    # Loaded databases shared by all instances reading the same config_dir
+    _SHARED_STATE: ClassVar[Dict[Path, Dict[str, Any]]] = {}
+    
+    # Attributes populated by _load_database on first access
+    _LAZY_ATTRIBUTES = frozenset([
+        "_instruments",
+        "_roll_config_codes",
+        "_additional_info_codes",
+        "_config_cache",
+        "_config_raw_cache",
+        "_ib_specs_cache",
+        "_get_config",
+        "_get_ib_specs",
+        "_get_roll_config",
+        "_get_additional_info",
+        "_by_asset_class",
+        "_by_region",
+        "_by_currency",
+        "_codes",
+        "_valid_codes",
+        "_search_blobs",
+        "_instrument_count",
+        "_asset_class_distribution",
+        "_region_distribution",
+        "_by_subclass",
+        "_by_style",
+        "_by_country",
+    ])
+    
     def __init__(self, config_dir: Optional[str] = None):
         """
         Initialize with comprehensive instrument database from CSV files.
@@ -88,402 +294,580 @@ class InstrumentConfig:
             config_dir = Path(__file__).parent
         
         self.config_dir = Path(config_dir)
+    
+    def __getattr__(self, name: str) -> Any:
+        """Load the instrument database the first time one of its attributes is read."""
+        if name in InstrumentConfig._LAZY_ATTRIBUTES:
+            self._load_database()
+            return self.__dict__[name]
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+    
+    def _load_database(self):
+        """
+        Load the snapshot or CSV files and build the lookup caches.
+        
+        The result is shared with every other instance for the same
+        config_dir, so the database is only built once per directory.
+        """
+        key = self.config_dir.resolve()
+        shared = InstrumentConfig._SHARED_STATE.get(key)
+        if shared is not None:
+            self.__dict__.update(shared)
+            return
+        
+        try:
+            if not self._load_snapshot():
+                self._load_csv_sources()
+            self._build_lookup_caches()
+        except Exception:
+            # Leave nothing half-loaded so the next access retries
+            for name in InstrumentConfig._LAZY_ATTRIBUTES:
+                self.__dict__.pop(name, None)
+            raise
+        
+        InstrumentConfig._SHARED_STATE[key] = {
+            name: self.__dict__[name] for name in InstrumentConfig._LAZY_ATTRIBUTES
+        }
+    
+    def _load_csv_sources(self):
+        """
+        Parse the configuration CSV files into the instrument database.
+        
+        The roll and additional-info files are left-joined onto the instrument
+        file so every InstrumentInfo is built in a single pass.
+        """
         self._instruments = {}
-        self._roll_configs = {}
-        self._additional_info = {}
+        roll_config_codes = set()
+        additional_info_codes = set()
+        
+        base, roll, info = (
+            self._load_csv(filename, required, getattr(self, preparer_name), label)
+            for filename, required, preparer_name, label in self._CSV_SOURCES
+        )
+        
+        merged = base
+        if roll is not None:
+            merged = merged.merge(roll, on='Instrument', how='left', indicator='_has_roll')
+        if info is not None:
+            merged = merged.merge(info, on='Instrument', how='left', indicator='_has_info')
+        
+        def column(name, default=None):
+            return merged[name].tolist() if name in merged.columns else [default] * len(merged)
+        
+        has_roll = [flag == 'both' for flag in column('_has_roll', 'left_only')]
+        has_info = [flag == 'both' for flag in column('_has_info', 'left_only')]
+        roll_columns = list(zip(
+            column('HoldRollCycle'),
+            column('PricedRollCycle'),
+            column('RollOffsetDays'),
+            column('ExpiryOffset'),
+            column('CarryOffset'),
+        ))
+        info_fields = list(self._ADDITIONAL_INFO_COLUMNS)
+        info_columns = list(zip(*(column(field) for field in info_fields)))
+        
+        rows = zip(
+            column('Instrument'),
+            column('Description'),
+            column('Currency'),
+            column('AssetClass'),
+            column('Region'),
+            column('Pointsize'),
+            column('PerBlock'),
+            column('Percentage'),
+            column('PerTrade'),
+            has_roll,
+            roll_columns,
+            has_info,
+            info_columns,
+        )
+        for (code, description, currency, asset_class, region, pointsize, per_block,
+                percentage, per_trade, row_has_roll, roll_values, row_has_info, info_values) in rows:
+            # Codes key every cache and index; one shared object makes their hashing and comparison cheap
+            code = sys.intern(code)
+            fields = {}
+            
+            if row_has_roll:
+                hold_cycle, priced_cycle, roll_offset_days, expiry_offset, carry_offset = roll_values
+                # Few distinct cycles exist, so share one string per value
+                fields.update(
+                    hold_cycle=sys.intern(hold_cycle),
+                    priced_cycle=sys.intern(priced_cycle),
+                    roll_offset_days=roll_offset_days,
+                    expiry_offset=expiry_offset,
+                    carry_offset=carry_offset
+                )
+                roll_config_codes.add(code)
+            
+            if row_has_info:
+                # Classification values repeat heavily (country, style, ...), so share them too
+                fields.update(
+                    (field, sys.intern(value) if value is not None else None)
+                    for field, value in zip(info_fields, info_values)
+                )
+                additional_info_codes.add(code)
+            
+            self._instruments[code] = InstrumentInfo(
+                instrument_code=code,
+                description=description,
+                pointsize=pointsize,
+                currency=sys.intern(currency),
+                # Enum values match the CSV strings, so look members up by value directly
+                asset_class=AssetClass._value2member_map_.get(asset_class, AssetClass.OTHER),
+                region=Region._value2member_map_.get(region, Region.US),
+                per_block=per_block,
+                percentage=percentage,
+                per_trade=per_trade,
+                **fields
+            )
+        
+        # Roll and classification fields live on InstrumentInfo; only record which rows had them
+        self._roll_config_codes: FrozenSet[str] = frozenset(roll_config_codes)
+        self._additional_info_codes: FrozenSet[str] = frozenset(additional_info_codes)
+    
+    def _csv_fingerprint(self) -> str:
+        """Hash the contents of the configuration CSV files."""
+        digest = hashlib.sha256()
+        for filename, _, _, _ in self._CSV_SOURCES:
+            filepath = self.config_dir / filename
+            digest.update(filename.encode())
+            if filepath.exists():
+                digest.update(filepath.read_bytes())
+        return digest.hexdigest()
+    
+    def _snapshot_header(self) -> bytes:
+        """Build the snapshot header line for the current CSV files."""
+        return b"%s %d %s\n" % (
+            self._SNAPSHOT_MAGIC, self._SNAPSHOT_FORMAT, self._csv_fingerprint().encode()
+        )
+    
+    def _load_snapshot(self) -> bool:
+        """
+        Load the instrument database from the pickled snapshot if it is current.
         
-        self._load_instrument_config()
-        self._load_roll_config()
-        self._load_additional_info()
+        Only the snapshot shipped in the package's own config directory is
+        trusted, and its header must match a hash of the CSV files before the
+        pickle is read.
+        
+        Returns:
+            True if the snapshot matched the CSV files and was loaded
+        """
+        if self.config_dir.resolve() != self._PACKAGE_CONFIG_DIR:
+            return False
+        
+        snapshot_file = self._PACKAGE_CONFIG_DIR / self._SNAPSHOT_FILE
+        if not snapshot_file.is_file():
+            return False
+        
+        try:
+            header = self._snapshot_header()
+            data = snapshot_file.read_bytes()
+            if not data.startswith(header):
+                logger.debug(f"Instrument snapshot {snapshot_file} is out of date; parsing CSV files")
+                return False
+            
+            snapshot = pickle.loads(data[len(header):])
+            self._instruments = snapshot["instruments"]
+            self._roll_config_codes = snapshot["roll_config_codes"]
+            self._additional_info_codes = snapshot["additional_info_codes"]
+            return True
+            
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable instrument snapshot {snapshot_file}: {e}")
+            return False
     
-    def _load_instrument_config(self):
-        """Load basic instrument configuration from instrumentconfig.csv."""
-        config_file = self.config_dir / "instrumentconfig.csv"
+    def write_snapshot(self, path: Optional[str] = None) -> Path:
+        """
+        Write the loaded instrument database to a pickle snapshot.
         
-        if not config_file.exists():
-            raise FileNotFoundError(f"Instrument configuration file not found: {config_file}")
+        The snapshot starts with a header holding a hash of the CSV files and
+        is ignored once they change. It is only ever loaded from the
+        package's own config directory.
         
-        with open(config_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
+        Args:
+            path: Output file. Defaults to the snapshot file in config_dir.
             
-            for row in reader:
-                try:
-                    # Parse basic fields
-                    instrument_code = row['Instrument']
-                    description = row['Description']
-                    pointsize = float(row['Pointsize'])
-                    currency = row['Currency']
-                    asset_class_str = row['AssetClass']
-                    per_block = float(row['PerBlock']) if row['PerBlock'] else 0.0
-                    percentage = float(row['Percentage']) if row['Percentage'] else 0.0
-                    per_trade = float(row['PerTrade']) if row['PerTrade'] else 0.0
-                    region_str = row['Region']
-                    
-                    # Map asset class string to enum
-                    asset_class = self._map_asset_class(asset_class_str)
-                    
-                    # Map region string to enum
-                    region = self._map_region(region_str)
-                    
-                    # Create instrument info
-                    self._instruments[instrument_code] = InstrumentInfo(
-                        instrument_code=instrument_code,
-                        description=description,
-                        pointsize=pointsize,
-                        currency=currency,
-                        asset_class=asset_class,
-                        region=region,
-                        per_block=per_block,
-                        percentage=percentage,
-                        per_trade=per_trade
-                    )
-                    
-                except (ValueError, KeyError) as e:
-                    print(f"Warning: Error parsing instrument {row.get('Instrument', 'Unknown')}: {e}")
-                    continue
-    
-    def _load_roll_config(self):
-        """Load roll configuration from rollconfig.csv."""
-        roll_file = self.config_dir / "rollconfig.csv"
-        
-        if not roll_file.exists():
-            print(f"Warning: Roll configuration file not found: {roll_file}")
-            return
+        Returns:
+            Path of the written snapshot
+        """
+        snapshot_file = Path(path) if path is not None else self.config_dir / self._SNAPSHOT_FILE
+        payload = self._snapshot_header() + pickle.dumps({
+            "instruments": self._instruments,
+            "roll_config_codes": self._roll_config_codes,
+            "additional_info_codes": self._additional_info_codes,
+        }, protocol=pickle.HIGHEST_PROTOCOL)
         
-        with open(roll_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
+        temp_file = snapshot_file.with_name(f"{snapshot_file.name}.{os.getpid()}.tmp")
+        temp_file.write_bytes(payload)
+        os.replace(temp_file, snapshot_file)
+        return snapshot_file
+    
+    def _load_csv(self, filename: str, required: bool, preparer, label: str):
+        """
+        Parse a configuration CSV file in bulk and clean it with a frame preparer.
+        
+        Args:
+            filename: CSV file name inside config_dir
+            required: Raise if the file is missing instead of warning
+            preparer: Callable taking the parsed DataFrame and label
+            label: Description used in warning messages
             
-            for row in reader:
-                try:
-                    instrument_code = row['Instrument']
-                    
-                    if instrument_code in self._instruments:
-                        # Update roll parameters
-                        instrument = self._instruments[instrument_code]
-                        instrument.hold_cycle = row['HoldRollCycle']
-                        instrument.priced_cycle = row['PricedRollCycle']
-                        instrument.roll_offset_days = int(row['RollOffsetDays'])
-                        instrument.expiry_offset = int(row['ExpiryOffset'])
-                        instrument.carry_offset = int(row['CarryOffset'])
-                        
-                        # Store roll config for quick access
-                        self._roll_configs[instrument_code] = {
-                            'hold_cycle': row['HoldRollCycle'],
-                            'priced_cycle': row['PricedRollCycle'],
-                            'roll_offset_days': int(row['RollOffsetDays']),
-                            'expiry_offset': int(row['ExpiryOffset']),
-                            'carry_offset': int(row['CarryOffset'])
-                        }
-                        
-                except (ValueError, KeyError) as e:
-                    print(f"Warning: Error parsing roll config for {row.get('Instrument', 'Unknown')}: {e}")
-                    continue
-    
-    def _load_additional_info(self):
-        """Load additional instrument information from moreinstrumentinfo.csv."""
-        info_file = self.config_dir / "moreinstrumentinfo.csv"
-        
-        if not info_file.exists():
-            print(f"Warning: Additional instrument info file not found: {info_file}")
-            return
+        Returns:
+            Prepared DataFrame, or None if the file is missing or unusable
+        """
+        filepath = self.config_dir / filename
+        
+        if not filepath.exists():
+            if required:
+                raise FileNotFoundError(f"{label.capitalize()} file not found: {filepath}")
+            logger.warning(f"{label.capitalize()} file not found: {filepath}")
+            return None
+        
+        # Imported here so loading from a cached pickle never pays for pandas
+        import pandas as pd
+        
+        # Read every field as text, like csv.DictReader; numbers are converted in bulk.
+        # memory_map lets the C parser scan the mapped file without buffered reads.
+        frame = pd.read_csv(
+            filepath, dtype=str, keep_default_na=False, encoding='utf-8', memory_map=True
+        )
         
-        with open(info_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
+        try:
+            return preparer(frame, label)
+        except KeyError as e:
+            if required:
+                raise
+            logger.warning(f"Error parsing {label} file {filepath}: missing column {e}")
+            return None
+    
+    def _prepare_instrument_frame(self, frame, label: str):
+        """Convert the instrumentconfig.csv numeric columns, dropping invalid rows."""
+        columns = ['Instrument', 'Description', 'Currency', 'AssetClass', 'Region']
+        frame, numbers = _parse_numeric_columns(
+            frame[columns + ['Pointsize', 'PerBlock', 'Percentage', 'PerTrade']], label,
+            {'Pointsize': None, 'PerBlock': 0.0, 'Percentage': 0.0, 'PerTrade': 0.0}
+        )
+        return frame[columns].assign(**numbers)
+    
+    def _prepare_roll_frame(self, frame, label: str):
+        """Convert the rollconfig.csv offsets, keeping the last valid row per instrument."""
+        columns = ['Instrument', 'HoldRollCycle', 'PricedRollCycle']
+        frame, numbers = _parse_numeric_columns(
+            frame[columns + ['RollOffsetDays', 'ExpiryOffset', 'CarryOffset']], label,
+            {'RollOffsetDays': None, 'ExpiryOffset': None, 'CarryOffset': None},
+            integer=True
+        )
+        # Nullable integers survive the left join without being widened to float
+        frame = frame[columns].assign(**numbers).astype({column: 'Int64' for column in numbers})
+        return frame.drop_duplicates('Instrument', keep='last')
+    
+    def _prepare_additional_info_frame(self, frame, label: str):
+        """Select the moreinstrumentinfo.csv classification columns, keeping the last row per instrument."""
+        # Absent optional columns give None, like DictReader's row.get
+        frame = frame.assign(**{
+            column: None for column in self._ADDITIONAL_INFO_COLUMNS.values()
+            if column not in frame.columns
+        })
+        frame = frame[['Instrument'] + list(self._ADDITIONAL_INFO_COLUMNS.values())]
+        frame = frame.rename(columns={
+            column: field for field, column in self._ADDITIONAL_INFO_COLUMNS.items()
+        })
+        return frame.drop_duplicates('Instrument', keep='last')
+    
+    def _build_lookup_caches(self):
+        """Precompute the read-only dictionaries returned by the lookup methods."""
+        self._config_cache: Dict[str, Mapping[str, Any]] = {}
+        self._config_raw_cache: Dict[str, Mapping[str, Any]] = {}
+        self._ib_specs_cache: Dict[str, Mapping[str, Any]] = {}
+        by_asset_class = defaultdict(list)
+        by_region = defaultdict(list)
+        by_currency = defaultdict(list)
+        by_subclass = defaultdict(list)
+        by_style = defaultdict(list)
+        by_country = defaultdict(list)
+        
+        for code, instrument in self._instruments.items():
+            by_asset_class[instrument.asset_class].append(code)
+            by_region[instrument.region].append(code)
+            by_currency[instrument.currency].append(code)
+            by_subclass[instrument.subclass].append(code)
+            by_style[instrument.style].append(code)
+            by_country[instrument.country].append(code)
             
-            for row in reader:
-                try:
-                    instrument_code = row['Instrument']
-                    
-                    if instrument_code in self._instruments:
-                        # Update additional fields
-                        instrument = self._instruments[instrument_code]
-                        instrument.subclass = row.get('SubClass')
-                        instrument.sub_subclass = row.get('SubSubClass')
-                        instrument.style = row.get('Style')
-                        instrument.country = row.get('Country')
-                        instrument.duration = row.get('Duration')
-                        
-                        # Store additional info for quick access
-                        self._additional_info[instrument_code] = {
-                            'subclass': row.get('SubClass'),
-                            'sub_subclass': row.get('SubSubClass'),
-                            'style': row.get('Style'),
-                            'country': row.get('Country'),
-                            'duration': row.get('Duration')
-                        }
-                        
-                except (KeyError) as e:
-                    print(f"Warning: Error parsing additional info for {row.get('Instrument', 'Unknown')}: {e}")
-                    continue
-    
-    def _map_asset_class(self, asset_class_str: str) -> AssetClass:
-        """Map asset class string to AssetClass enum."""
-        mapping = {
-            'Equity': AssetClass.EQUITY,
-            'Bond': AssetClass.BOND,
-            'FX': AssetClass.FX,
-            'Metals': AssetClass.METALS,
-            'OilGas': AssetClass.OILGAS,
-            'Ags': AssetClass.AGS,
-            'STIR': AssetClass.STIR,
-            'Sector': AssetClass.SECTOR,
-            'Vol': AssetClass.VOL,
-            'Housing': AssetClass.HOUSING,
-            'SingleStock': AssetClass.SINGLE_STOCK,
-            'Weather': AssetClass.WEATHER,
-            'Other': AssetClass.OTHER,
-            'CommodityIndex': AssetClass.COMMODITY_INDEX
+            # Built once per load: instances are slotted, so there is no per-instance cached_property
+            raw_config = instrument.as_config_dict()
+            self._config_raw_cache[code] = MappingProxyType(raw_config)
+            self._config_cache[code] = MappingProxyType({
+                key: value for key, value in raw_config.items() if value is not None
+            })
+            self._ib_specs_cache[code] = MappingProxyType(instrument.as_ib_specs())
+        
+        # Memoized lookups so hot symbols skip even the dictionary probe
+        self._get_config = functools.lru_cache(maxsize=256)(self._config_cache.get)
+        self._get_ib_specs = functools.lru_cache(maxsize=256)(self._ib_specs_cache.get)
+        # Read-only roll and classification views for the instruments whose CSV rows provided them
+        roll_config_views = {
+            code: MappingProxyType(self._instruments[code].as_roll_config())
+            for code in self._roll_config_codes
         }
+        additional_info_views = {
+            code: MappingProxyType(self._instruments[code].as_additional_info())
+            for code in self._additional_info_codes
+        }
+        self._get_roll_config = functools.lru_cache(maxsize=256)(roll_config_views.get)
+        self._get_additional_info = functools.lru_cache(maxsize=256)(additional_info_views.get)
         
-        return mapping.get(asset_class_str, AssetClass.OTHER)
-    
-    def _map_region(self, region_str: str) -> Region:
-        """Map region string to Region enum."""
-        mapping = {
-            'US': Region.US,
-            'EMEA': Region.EMEA,
-            'ASIA': Region.ASIA
+        # Reverse indexes for the filter methods
+        self._by_asset_class: Dict[AssetClass, Tuple[str, ...]] = {
+            key: tuple(codes) for key, codes in by_asset_class.items()
+        }
+        self._by_region: Dict[Region, Tuple[str, ...]] = {
+            key: tuple(codes) for key, codes in by_region.items()
+        }
+        self._by_currency: Dict[str, Tuple[str, ...]] = {
+            key: tuple(codes) for key, codes in by_currency.items()
+        }
+        self._by_subclass: Dict[Optional[str], Tuple[str, ...]] = {
+            key: tuple(codes) for key, codes in by_subclass.items()
+        }
+        self._by_style: Dict[Optional[str], Tuple[str, ...]] = {
+            key: tuple(codes) for key, codes in by_style.items()
+        }
+        self._by_country: Dict[Optional[str], Tuple[str, ...]] = {
+            key: tuple(codes) for key, codes in by_country.items()
         }
         
-        return mapping.get(region_str, Region.US)
+        self._codes: Tuple[str, ...] = tuple(self._instruments)
+        self._valid_codes: FrozenSet[str] = frozenset(self._codes)
+        
+        # Summary statistics, read straight off the indexes
+        self._instrument_count = len(self._codes)
+        self._asset_class_distribution: Mapping[str, int] = MappingProxyType({
+            key.value: len(codes) for key, codes in self._by_asset_class.items()
+        })
+        self._region_distribution: Mapping[str, int] = MappingProxyType({
+            key.value: len(codes) for key, codes in self._by_region.items()
+        })
+        
+        # Lowercased searchable fields per instrument, aligned with _codes
+        self._search_blobs: Tuple[str, ...] = tuple(
+            f"{code}\n{instrument.description}\n{instrument.subclass or ''}\n{instrument.country or ''}".lower()
+            for code, instrument in self._instruments.items()
+        )
+    
+    def add_instrument(self, instrument: InstrumentInfo):
+        """
+        Add or replace an instrument and refresh the lookup caches.
+        
+        Only this instance sees the change; the shared database is copied first.
+        
+        Args:
+            instrument: Instrument configuration to register
+        """
+        self._instruments = dict(self._instruments)
+        self._instruments[instrument.instrument_code] = instrument
+        self._build_lookup_caches()
     
     def get_config(self, instrument_code: str) -> Optional[Dict[str, Any]]:
-        """Get configuration for a specific instrument."""
-        instrument = self._instruments.get(instrument_code)
-        if not instrument:
-            return None
+        """
+        Get configuration for a specific instrument.
         
-        return {
-            "instrument_code": instrument.instrument_code,
-            "description": instrument.description,
-            "pointsize": instrument.pointsize,
-            "currency": instrument.currency,
-            "asset_class": instrument.asset_class.value,
-            "region": instrument.region.value,
-            "per_block": instrument.per_block,
-            "percentage": instrument.percentage,
-            "per_trade": instrument.per_trade,
-            "hold_cycle": instrument.hold_cycle,
-            "priced_cycle": instrument.priced_cycle,
-            "roll_offset_days": instrument.roll_offset_days,
-            "expiry_offset": instrument.expiry_offset,
-            "carry_offset": instrument.carry_offset,
-            "subclass": instrument.subclass,
-            "sub_subclass": instrument.sub_subclass,
-            "style": instrument.style,
-            "country": instrument.country,
-            "duration": instrument.duration,
-            "ib_symbol": instrument.ib_symbol,
-            "ib_exchange": instrument.ib_exchange,
-            "ib_currency": instrument.ib_currency,
-            "ib_multiplier": instrument.ib_multiplier,
-        }
+        Returns a new dict copied from the cached configuration, so callers
+        may modify or serialize it. Fields without a value (e.g. unset IB
+        details) are omitted; use get_config_raw() when every key must be present.
+        """
+        config = self._get_config(instrument_code)
+        return dict(config) if config is not None else None
+    
+    def get_config_raw(self, instrument_code: str) -> Optional[Dict[str, Any]]:
+        """Get configuration for an instrument including keys whose value is None."""
+        config = self._config_raw_cache.get(instrument_code)
+        return dict(config) if config is not None else None
     
     def get_all_instruments(self) -> List[str]:
-        """Get list of all available instrument codes."""
-        return list(self._instruments.keys())
+        """Get all available instrument codes."""
+        return list(self._codes)
     
     def get_instruments_by_asset_class(self, asset_class: AssetClass) -> List[str]:
         """Get instruments filtered by asset class."""
-        return [
-            code for code, instrument in self._instruments.items()
-            if instrument.asset_class == asset_class
-        ]
+        return list(self._by_asset_class.get(asset_class, ()))
     
     def get_instruments_by_region(self, region: Region) -> List[str]:
         """Get instruments filtered by region."""
-        return [
-            code for code, instrument in self._instruments.items()
-            if instrument.region == region
-        ]
+        return list(self._by_region.get(region, ()))
     
     def get_instruments_by_currency(self, currency: str) -> List[str]:
         """Get instruments filtered by currency."""
-        return [
-            code for code, instrument in self._instruments.items()
-            if instrument.currency == currency
-        ]
+        return list(self._by_currency.get(currency, ()))
     
     def get_instruments_by_subclass(self, subclass: str) -> List[str]:
         """Get instruments filtered by subclass."""
-        return [
-            code for code, instrument in self._instruments.items()
-            if instrument.subclass == subclass
-        ]
+        return list(self._by_subclass.get(subclass, ()))
     
     def get_instruments_by_style(self, style: str) -> List[str]:
         """Get instruments filtered by style."""
-        return [
-            code for code, instrument in self._instruments.items()
-            if instrument.style == style
-        ]
+        return list(self._by_style.get(style, ()))
     
     def get_instruments_by_country(self, country: str) -> List[str]:
         """Get instruments filtered by country."""
-        return [
-            code for code, instrument in self._instruments.items()
-            if instrument.country == country
-        ]
+        return list(self._by_country.get(country, ()))
     
     def validate_instrument(self, instrument_code: str) -> bool:
         """Check if an instrument code is valid."""
-        return instrument_code in self._instruments
+        return instrument_code in self._valid_codes
     
-    def get_roll_config(self, instrument_code: str) -> Optional[Dict[str, Any]]:
-        """Get roll configuration for a specific instrument."""
-        return self._roll_configs.get(instrument_code)
+    def get_roll_config(self, instrument_code: str) -> Optional[Mapping[str, Any]]:
+        """
+        Get roll configuration for a specific instrument.
+        
+        Returns a cached read-only mapping; copy it with dict() to modify.
+        """
+        return self._get_roll_config(instrument_code)
     
-    def get_additional_info(self, instrument_code: str) -> Optional[Dict[str, Any]]:
-        """Get additional classification information for an instrument."""
-        return self._additional_info.get(instrument_code)
+    def get_additional_info(self, instrument_code: str) -> Optional[Mapping[str, Any]]:
+        """
+        Get additional classification information for an instrument.
+        
+        Returns a cached read-only mapping; copy it with dict() to modify.
+        """
+        return self._get_additional_info(instrument_code)
     
-    def get_ib_contract_specs(self, instrument_code: str) -> Optional[Dict[str, Any]]:
-        """Get Interactive Brokers contract specifications for an instrument."""
-        instrument = self._instruments.get(instrument_code)
-        if not instrument:
-            return None
+    def get_ib_contract_specs(self, instrument_code: str) -> Optional[Mapping[str, Any]]:
+        """
+        Get Interactive Brokers contract specifications for an instrument.
         
-        return {
-            "symbol": instrument.ib_symbol,
-            "exchange": instrument.ib_exchange,
-            "currency": instrument.ib_currency,
-            "multiplier": instrument.ib_multiplier or instrument.pointsize,
-            "secType": "FUT"
-        }
+        Returns a cached read-only mapping; copy it with dict() to modify.
+        """
+        return self._get_ib_specs(instrument_code)
     
     def get_instrument_count(self) -> int:
         """Get total number of instruments."""
-        return len(self._instruments)
-    
-    def get_asset_class_distribution(self) -> Dict[str, int]:
-        """Get distribution of instruments by asset class."""
-        distribution = {}
-        for instrument in self._instruments.values():
-            asset_class = instrument.asset_class.value
-            distribution[asset_class] = distribution.get(asset_class, 0) + 1
-        return distribution
-    
-    def get_region_distribution(self) -> Dict[str, int]:
-        """Get distribution of instruments by region."""
-        distribution = {}
-        for instrument in self._instruments.values():
-            region = instrument.region.value
-            distribution[region] = distribution.get(region, 0) + 1
-        return distribution
+        return self._instrument_count
+    
+    def get_asset_class_distribution(self) -> Mapping[str, int]:
+        """Get distribution of instruments by asset class as a read-only mapping."""
+        return self._asset_class_distribution
+    
+    def get_region_distribution(self) -> Mapping[str, int]:
+        """Get distribution of instruments by region as a read-only mapping."""
+        return self._region_distribution
     
     def search_instruments(self, query: str) -> List[str]:
         """Search instruments by description or code."""
-        query = query.lower()
-        results = []
-        
-        for code, instrument in self._instruments.items():
-            if (query in code.lower() or 
-                query in instrument.description.lower() or
-                (instrument.subclass and query in instrument.subclass.lower()) or
-                (instrument.country and query in instrument.country.lower())):
-                results.append(code)
-        
-        return results
+        matches = map(contains, self._search_blobs, repeat(query.lower()))
+        return list(compress(self._codes, matches))
+
+
+# Predefined instrument groups (tuples for iteration, frozensets for membership tests)
+MAJOR_EQUITY_INDICES = (
+    "SP500", "DAX", "CAC", "EUROSTX", "FTSE100", "NIKKEI",
+    "ASX", "HANG", "RUSSELL", "DOW", "NASDAQ"
+)
+MAJOR_BONDS = (
+    "US10", "US20", "US30", "US5", "US2", "BUND", "BOBL",
+    "SHATZ", "OAT", "BTP", "JGB", "GILT"
+)
+MAJOR_COMMODITIES = (
+    "GOLD", "SILVER", "COPPER", "CRUDE_W", "GAS_US", "BRENT",
+    "CORN", "WHEAT", "SOYBEAN", "SUGAR11", "COFFEE"
+)
+MAJOR_FX = (
+    "EUR", "GBP", "JPY", "AUD", "CAD", "CHF", "NZD", "MXP"
+)
+CORE_PORTFOLIO = MAJOR_EQUITY_INDICES + MAJOR_BONDS + MAJOR_COMMODITIES + MAJOR_FX
+
+MAJOR_EQUITY_INDICES_SET = frozenset(MAJOR_EQUITY_INDICES)
+MAJOR_BONDS_SET = frozenset(MAJOR_BONDS)
+MAJOR_COMMODITIES_SET = frozenset(MAJOR_COMMODITIES)
+MAJOR_FX_SET = frozenset(MAJOR_FX)
+CORE_PORTFOLIO_SET = frozenset(CORE_PORTFOLIO)
 
 
-# Predefined instrument groups for easy access
 def get_major_equity_indices(config: InstrumentConfig) -> List[str]:
     """Get major equity indices."""
-    return [
-        "SP500", "DAX", "CAC", "EUROSTX", "FTSE100", "NIKKEI", 
-        "ASX", "HANG", "RUSSELL", "DOW", "NASDAQ", "FTSE100"
-    ]
+    return list(MAJOR_EQUITY_INDICES)
 
 def get_major_bonds(config: InstrumentConfig) -> List[str]:
     """Get major government bonds."""
-    return [
-        "US10", "US20", "US30", "US5", "US2", "BUND", "BOBL", 
-        "SHATZ", "OAT", "BTP", "JGB", "GILT"
-    ]
+    return list(MAJOR_BONDS)
 
 def get_major_commodities(config: InstrumentConfig) -> List[str]:
     """Get major commodity contracts."""
-    return [
-        "GOLD", "SILVER", "COPPER", "CRUDE_W", "GAS_US", "BRENT",
-        "CORN", "WHEAT", "SOYBEAN", "SUGAR11", "COFFEE"
-    ]
+    return list(MAJOR_COMMODITIES)
 
 def get_major_fx(config: InstrumentConfig) -> List[str]:
     """Get major currency pairs."""
-    return [
-        "EUR", "GBP", "JPY", "AUD", "CAD", "CHF", "NZD", "MXP"
-    ]
+    return list(MAJOR_FX)
 
 def get_core_portfolio(config: InstrumentConfig) -> List[str]:
     """Get core portfolio instruments."""
-    return (get_major_equity_indices(config) + 
-            get_major_bonds(config) + 
-            get_major_commodities(config) + 
-            get_major_fx(config))
+    return list(CORE_PORTFOLIO)
 
 
-# Default roll parameters by asset class (fallback when CSV not available)
-DEFAULT_ROLL_PARAMETERS = {
-    AssetClass.EQUITY: {
-        "hold_cycle": "HMUZ",
-        "priced_cycle": "HMUZ", 
+# Default roll parameters by asset class (fallback when CSV not available), read-only throughout
+DEFAULT_ROLL_PARAMETERS: Mapping[AssetClass, Mapping[str, Any]] = MappingProxyType({
+    AssetClass.EQUITY: MappingProxyType({
+        "hold_cycle": _HOLD_FINANCIAL,
+        "priced_cycle": _HOLD_FINANCIAL, 
         "roll_offset_days": -5,
         "expiry_offset": 0,
         "carry_offset": -1
-    },
-    AssetClass.BOND: {
-        "hold_cycle": "HMUZ",
-        "priced_cycle": "HMUZ",
+    }),
+    AssetClass.BOND: MappingProxyType({
+        "hold_cycle": _HOLD_FINANCIAL,
+        "priced_cycle": _HOLD_FINANCIAL,
         "roll_offset_days": -5,
         "expiry_offset": 0,
         "carry_offset": -1
-    },
-    AssetClass.FX: {
-        "hold_cycle": "HMUZ",
-        "priced_cycle": "HMUZ",
+    }),
+    AssetClass.FX: MappingProxyType({
+        "hold_cycle": _HOLD_FINANCIAL,
+        "priced_cycle": _HOLD_FINANCIAL,
         "roll_offset_days": -5,
         "expiry_offset": 0,
         "carry_offset": -1
-    },
-    AssetClass.METALS: {
-        "hold_cycle": "GJMQVZ",
-        "priced_cycle": "GJMQVZ",
+    }),
+    AssetClass.METALS: MappingProxyType({
+        "hold_cycle": _HOLD_METALS,
+        "priced_cycle": _HOLD_METALS,
         "roll_offset_days": -5,
         "expiry_offset": 0,
         "carry_offset": -1
-    },
-    AssetClass.OILGAS: {
-        "hold_cycle": "FGHJKMNQUVXZ",
-        "priced_cycle": "FGHJKMNQUVXZ",
+    }),
+    AssetClass.OILGAS: MappingProxyType({
+        "hold_cycle": _HOLD_MONTHLY,
+        "priced_cycle": _HOLD_MONTHLY,
         "roll_offset_days": -3,
         "expiry_offset": 0,
         "carry_offset": -1
-    },
-    AssetClass.AGS: {
-        "hold_cycle": "HKNUZ",
-        "priced_cycle": "FGHJKMNQUVXZ",
+    }),
+    AssetClass.AGS: MappingProxyType({
+        "hold_cycle": _HOLD_AGS,
+        "priced_cycle": _HOLD_MONTHLY,
         "roll_offset_days": -5,
         "expiry_offset": 0,
         "carry_offset": -1
-    },
-    AssetClass.VOL: {
-        "hold_cycle": "FGHJKMNQUVXZ",
-        "priced_cycle": "FGHJKMNQUVXZ",
+    }),
+    AssetClass.VOL: MappingProxyType({
+        "hold_cycle": _HOLD_MONTHLY,
+        "priced_cycle": _HOLD_MONTHLY,
         "roll_offset_days": -30,
         "expiry_offset": 0,
         "carry_offset": -1
-    },
-    AssetClass.STIR: {
-        "hold_cycle": "HMUZ",
-        "priced_cycle": "FGHJKMNQUVXZ",
+    }),
+    AssetClass.STIR: MappingProxyType({
+        "hold_cycle": _HOLD_FINANCIAL,
+        "priced_cycle": _HOLD_MONTHLY,
         "roll_offset_days": -1000,  # Very early roll for STIR
         "expiry_offset": 0,
         "carry_offset": -1
-    }
-}
+    })
+})
 
+_EQUITY_ROLL_PARAMETERS = DEFAULT_ROLL_PARAMETERS[AssetClass.EQUITY]
 
-def get_default_roll_parameters(asset_class: AssetClass) -> Dict[str, Any]:
+
+def get_default_roll_parameters(asset_class: AssetClass) -> Mapping[str, Any]:
     """
     Get default roll parameters for an asset class.
     
@@ -491,10 +875,36 @@ def get_default_roll_parameters(asset_class: AssetClass) -> Dict[str, Any]:
         asset_class: Asset class enum
         
     Returns:
-        Dictionary of roll parameters
+        Read-only mapping of roll parameters
     """
-    return DEFAULT_ROLL_PARAMETERS.get(asset_class, DEFAULT_ROLL_PARAMETERS[AssetClass.EQUITY])
+    return DEFAULT_ROLL_PARAMETERS.get(asset_class, _EQUITY_ROLL_PARAMETERS)
+
 
+@functools.lru_cache(maxsize=1)
+def get_default_config() -> InstrumentConfig:
+    """
+    Get the shared InstrumentConfig built from the packaged CSV files.
+    
+    The database is loaded once per process; prefer this over constructing
+    a new InstrumentConfig for read-only lookups.
+    """
+    return InstrumentConfig()
 
-# Create a default instance for backward compatibility
-DEFAULT_CONFIG = InstrumentConfig()
\ No newline at end of file
+
+def __getattr__(name: str) -> Any:
+    """Create DEFAULT_CONFIG (kept for backward compatibility) on first access."""
+    if name == "DEFAULT_CONFIG":
+        config = get_default_config()
+        globals()["DEFAULT_CONFIG"] = config
+        return config
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+if __name__ == "__main__":
+    # Regenerate the packaged snapshot from the CSV files. Import through the
+    # package so pickled classes resolve to this module rather than __main__.
+    from futures_data_manager.config.instruments import InstrumentConfig as _InstrumentConfig
+    
+    _config = _InstrumentConfig()
+    _config._load_csv_sources()
+    print(f"Wrote {_config.get_instrument_count()} instruments to {_config.write_snapshot()}")
@@ -3,10 +3,101 @@ Roll configuration module for futures contracts.
 Reads roll parameters from CSV files for maintainability and accuracy.
 """
 
-import csv
+import bisect
+import functools
+import re
+import sys
+from collections import Counter, defaultdict
 from pathlib import Path
-from typing import Dict, Any, Optional, List
-from instruments import AssetClass
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Mapping
+
+from loguru import logger
+
+from futures_data_manager.config.instruments import AssetClass
+
+
+# Validation constants for roll parameters
+_VALID_MONTHS = frozenset("FGHJKMNQUVXZ")
+_CYCLE_PATTERN = f"[{''.join(sorted(_VALID_MONTHS))}]+"
+_CYCLE_RE = re.compile(_CYCLE_PATTERN)
+
+# Roll offset limits: roll before expiry, but no more than ~5.5 years early (STIR),
+# and carry within a year
+_MIN_ROLL_OFFSET_DAYS = -2000
+_MAX_CARRY_OFFSET = 12
+
+
+def _compile_roll_validator():
+    """
+    Generate the roll parameter validator as straight-line code.
+    
+    The schema is fixed, so key lookups, exact type checks and the limits
+    above are emitted inline instead of being looped over at call time.
+    """
+    source = f"""
+def _validate_roll_parameters(params):
+    try:
+        hold_cycle = params["hold_cycle"]
+        priced_cycle = params["priced_cycle"]
+        roll_offset_days = params["roll_offset_days"]
+        carry_offset = params["carry_offset"]
+        params["expiry_offset"]
+    except KeyError:
+        return False
+    if not isinstance(hold_cycle, str) or not _fullmatch(hold_cycle):
+        return False
+    if not isinstance(priced_cycle, str) or not _fullmatch(priced_cycle):
+        return False
+    if type(roll_offset_days) is not int or not {_MIN_ROLL_OFFSET_DAYS} <= roll_offset_days <= 0:
+        return False
+    if type(carry_offset) is not int or not {-_MAX_CARRY_OFFSET} <= carry_offset <= {_MAX_CARRY_OFFSET}:
+        return False
+    return True
+"""
+    namespace = {"_fullmatch": _CYCLE_RE.fullmatch}
+    exec(source, namespace)
+    return namespace["_validate_roll_parameters"]
+
+
+_validate_roll_parameters = _compile_roll_validator()
+
+# rollconfig.csv columns used by RollConfigManager
+_ROLL_CSV_COLUMNS = frozenset(
+    ["Instrument", "HoldRollCycle", "PricedRollCycle", "RollOffsetDays", "ExpiryOffset", "CarryOffset"]
+)
+
+# Default roll parameters by asset class: (hold_cycle, priced_cycle, roll_offset_days).
+# Every default uses expiry_offset=0 and carry_offset=-1.
+_DEFAULT_ROLL_TABLE = {
+    AssetClass.EQUITY: ("HMUZ", "HMUZ", -5),
+    AssetClass.BOND: ("HMUZ", "HMUZ", -5),
+    AssetClass.FX: ("HMUZ", "HMUZ", -5),
+    AssetClass.METALS: ("GJMQVZ", "GJMQVZ", -5),
+    AssetClass.OILGAS: ("FGHJKMNQUVXZ", "FGHJKMNQUVXZ", -3),
+    AssetClass.AGS: ("HKNUZ", "FGHJKMNQUVXZ", -5),
+    AssetClass.VOL: ("FGHJKMNQUVXZ", "FGHJKMNQUVXZ", -30),
+    AssetClass.STIR: ("HMUZ", "FGHJKMNQUVXZ", -1000),  # Very early roll for STIR
+    AssetClass.SECTOR: ("HMUZ", "HMUZ", -5),
+    AssetClass.HOUSING: ("GKQX", "GKQX", -5),  # Quarterly cycles for housing
+    AssetClass.SINGLE_STOCK: ("HMUZ", "HMUZ", -5),
+    AssetClass.WEATHER: ("FGHJVXZ", "FGHJVXZ", -5),  # Seasonal cycles
+    AssetClass.OTHER: ("HMUZ", "HMUZ", -5),
+    AssetClass.COMMODITY_INDEX: ("HMUZ", "HMUZ", -5),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _default_roll_parameters(asset_class: AssetClass) -> Mapping[str, Any]:
+    """Materialize the read-only default roll parameters for an asset class in _DEFAULT_ROLL_TABLE."""
+    hold_cycle, priced_cycle, roll_offset_days = _DEFAULT_ROLL_TABLE[asset_class]
+    return MappingProxyType({
+        "hold_cycle": hold_cycle,
+        "priced_cycle": priced_cycle,
+        "roll_offset_days": roll_offset_days,
+        "expiry_offset": 0,
+        "carry_offset": -1
+    })
 
 
 class RollConfigManager:
@@ -28,147 +119,134 @@ class RollConfigManager:
         
         self.config_dir = Path(config_dir)
         self._roll_configs = {}
+        self._roll_frame = None
         self._default_params = {}
         
         self._load_roll_config()
+        self._build_roll_indexes()
         self._setup_default_parameters()
     
     def _load_roll_config(self):
-        """Load roll configuration from rollconfig.csv."""
+        """
+        Load roll configuration from rollconfig.csv.
+        
+        The file is parsed in bulk with pandas and validated column-wise with
+        the same rules as validate_roll_parameters.
+        """
         roll_file = self.config_dir / "rollconfig.csv"
         
         if not roll_file.exists():
-            print(f"Warning: Roll configuration file not found: {roll_file}")
+            logger.warning("Roll configuration file not found: {}", roll_file)
             return
         
-        with open(roll_file, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            
-            for row in reader:
-                try:
-                    instrument_code = row['Instrument']
-                    
-                    # Parse roll parameters
-                    roll_config = {
-                        'hold_cycle': row['HoldRollCycle'],
-                        'priced_cycle': row['PricedRollCycle'],
-                        'roll_offset_days': int(row['RollOffsetDays']),
-                        'expiry_offset': int(row['ExpiryOffset']),
-                        'carry_offset': int(row['CarryOffset'])
-                    }
-                    
-                    # Validate parameters before storing
-                    if self._validate_roll_parameters(roll_config):
-                        self._roll_configs[instrument_code] = roll_config
-                    else:
-                        print(f"Warning: Invalid roll parameters for {instrument_code}: {roll_config}")
-                        
-                except (ValueError, KeyError) as e:
-                    print(f"Warning: Error parsing roll config for {row.get('Instrument', 'Unknown')}: {e}")
-                    continue
+        import pandas as pd
+        
+        # Read the needed fields as text (offsets are converted below); other
+        # columns are skipped by the tokenizer instead of being materialized
+        frame = pd.read_csv(
+            roll_file, dtype=str, keep_default_na=False, encoding='utf-8', memory_map=True,
+            usecols=_ROLL_CSV_COLUMNS.__contains__
+        )
+        
+        try:
+            codes = frame['Instrument']
+            hold_cycles = frame['HoldRollCycle']
+            priced_cycles = frame['PricedRollCycle']
+            raw_offsets = frame[['RollOffsetDays', 'ExpiryOffset', 'CarryOffset']]
+        except KeyError as e:
+            logger.warning("Error parsing roll config file {}: missing column {}", roll_file, e)
+            return
+        
+        # Accept exactly what int() accepts for plain decimal integers
+        parsed = raw_offsets.apply(lambda column: column.str.fullmatch(r'\s*[+-]?\d+\s*')).all(axis=1)
+        for code, row in zip(codes[~parsed], raw_offsets[~parsed].itertuples(index=False)):
+            logger.warning("Error parsing roll config for {}: invalid integer in {}", code, tuple(row))
+        
+        codes = codes[parsed]
+        hold_cycles = hold_cycles[parsed]
+        priced_cycles = priced_cycles[parsed]
+        offsets = raw_offsets[parsed].astype('int64')
+        
+        valid = (
+            hold_cycles.str.fullmatch(_CYCLE_PATTERN)
+            & priced_cycles.str.fullmatch(_CYCLE_PATTERN)
+            & offsets['RollOffsetDays'].between(_MIN_ROLL_OFFSET_DAYS, 0)
+            & (offsets['CarryOffset'].abs() <= _MAX_CARRY_OFFSET)
+        )
+        
+        table = pd.DataFrame({
+            'hold_cycle': hold_cycles,
+            'priced_cycle': priced_cycles,
+            'roll_offset_days': offsets['RollOffsetDays'],
+            'expiry_offset': offsets['ExpiryOffset'],
+            'carry_offset': offsets['CarryOffset']
+        })
+        
+        # Rejected rows are only reported; the accepted ones are stored without further checks
+        for instrument_code, roll_config in zip(codes[~valid], table[~valid].to_dict('records')):
+            logger.warning("Invalid roll parameters for {}: {}", instrument_code, roll_config)
+        
+        accepted = table[valid]
+        rows = zip(
+            codes[valid].tolist(),
+            accepted['hold_cycle'].tolist(),
+            accepted['priced_cycle'].tolist(),
+            accepted['roll_offset_days'].tolist(),
+            accepted['expiry_offset'].tolist(),
+            accepted['carry_offset'].tolist()
+        )
+        for instrument_code, hold_cycle, priced_cycle, roll_offset_days, expiry_offset, carry_offset in rows:
+            # Only a few distinct cycles exist; interning shares them with the default table
+            self._roll_configs[instrument_code] = {
+                'hold_cycle': sys.intern(hold_cycle),
+                'priced_cycle': sys.intern(priced_cycle),
+                'roll_offset_days': roll_offset_days,
+                'expiry_offset': expiry_offset,
+                'carry_offset': carry_offset
+            }
+        
+        # Column-oriented copy of the accepted configurations for aggregate queries
+        self._roll_frame = pd.DataFrame.from_dict(self._roll_configs, orient='index')
+    
+    def _build_roll_indexes(self):
+        """Index the loaded roll configurations for the pattern and timing queries."""
+        by_hold_cycle = defaultdict(list)
+        by_priced_cycle = defaultdict(list)
+        by_roll_offset = defaultdict(list)
+        
+        for instrument_code, config in self._roll_configs.items():
+            by_hold_cycle[config['hold_cycle']].append(instrument_code)
+            by_priced_cycle[config['priced_cycle']].append(instrument_code)
+            by_roll_offset[config['roll_offset_days']].append(instrument_code)
+        
+        self._by_hold_cycle: Dict[str, List[str]] = dict(by_hold_cycle)
+        self._by_priced_cycle: Dict[str, List[str]] = dict(by_priced_cycle)
+        self._by_roll_offset: Dict[int, List[str]] = dict(by_roll_offset)
+        
+        # Read-only views handed out by get_instrument_roll_parameters
+        self._roll_config_views: Dict[str, Mapping[str, Any]] = {
+            instrument_code: MappingProxyType(config)
+            for instrument_code, config in self._roll_configs.items()
+        }
+        self._all_roll_configs_view = MappingProxyType(self._roll_config_views)
+        
+        # Roll offsets in ascending order, with each entry's position in _roll_configs
+        # so range results can be returned in configuration order
+        self._codes = list(self._roll_configs)
+        ordered = sorted(
+            (config['roll_offset_days'], position)
+            for position, config in enumerate(self._roll_configs.values())
+        )
+        self._sorted_offsets = [offset for offset, _ in ordered]
+        self._offset_positions = [position for _, position in ordered]
     
     def _setup_default_parameters(self):
         """Setup default roll parameters by asset class as fallback."""
         self._default_params = {
-            AssetClass.EQUITY: {
-                "hold_cycle": "HMUZ",
-                "priced_cycle": "HMUZ", 
-                "roll_offset_days": -5,
-                "expiry_offset": 0,
-                "carry_offset": -1
-            },
-            AssetClass.BOND: {
-                "hold_cycle": "HMUZ",
-                "priced_cycle": "HMUZ",
-                "roll_offset_days": -5,
-                "expiry_offset": 0,
-                "carry_offset": -1
-            },
-            AssetClass.FX: {
-                "hold_cycle": "HMUZ",
-                "priced_cycle": "HMUZ",
-                "roll_offset_days": -5,
-                "expiry_offset": 0,
-                "carry_offset": -1
-            },
-            AssetClass.METALS: {
-                "hold_cycle": "GJMQVZ",
-                "priced_cycle": "GJMQVZ",
-                "roll_offset_days": -5,
-                "expiry_offset": 0,
-                "carry_offset": -1
-            },
-            AssetClass.OILGAS: {
-                "hold_cycle": "FGHJKMNQUVXZ",
-                "priced_cycle": "FGHJKMNQUVXZ",
-                "roll_offset_days": -3,
-                "expiry_offset": 0,
-                "carry_offset": -1
-            },
-            AssetClass.AGS: {
-                "hold_cycle": "HKNUZ",
-                "priced_cycle": "FGHJKMNQUVXZ",
-                "roll_offset_days": -5,
-                "expiry_offset": 0,
-                "carry_offset": -1
-            },
-            AssetClass.VOL: {
-                "hold_cycle": "FGHJKMNQUVXZ",
-                "priced_cycle": "FGHJKMNQUVXZ",
-                "roll_offset_days": -30,
-                "expiry_offset": 0,
-                "carry_offset": -1
-            },
-            AssetClass.STIR: {
-                "hold_cycle": "HMUZ",
-                "priced_cycle": "FGHJKMNQUVXZ",
-                "roll_offset_days": -1000,  # Very early roll for STIR
-                "expiry_offset": 0,
-                "carry_offset": -1
-            },
-            AssetClass.SECTOR: {
-                "hold_cycle": "HMUZ",
-                "priced_cycle": "HMUZ",
-                "roll_offset_days": -5,
-                "expiry_offset": 0,
-                "carry_offset": -1
-            },
-            AssetClass.HOUSING: {
-                "hold_cycle": "GKQX",  # Quarterly cycles for housing
-                "priced_cycle": "GKQX",
-                "roll_offset_days": -5,
-                "expiry_offset": 0,
-                "carry_offset": -1
-            },
-            AssetClass.SINGLE_STOCK: {
-                "hold_cycle": "HMUZ",
-                "priced_cycle": "HMUZ",
-                "roll_offset_days": -5,
-                "expiry_offset": 0,
-                "carry_offset": -1
-            },
-            AssetClass.WEATHER: {
-                "hold_cycle": "FGHJVXZ",  # Seasonal cycles
-                "priced_cycle": "FGHJVXZ",
-                "roll_offset_days": -5,
-                "expiry_offset": 0,
-                "carry_offset": -1
-            },
-            AssetClass.OTHER: {
-                "hold_cycle": "HMUZ",
-                "priced_cycle": "HMUZ",
-                "roll_offset_days": -5,
-                "expiry_offset": 0,
-                "carry_offset": -1
-            },
-            AssetClass.COMMODITY_INDEX: {
-                "hold_cycle": "HMUZ",
-                "priced_cycle": "HMUZ",
-                "roll_offset_days": -5,
-                "expiry_offset": 0,
-                "carry_offset": -1
-            }
+            asset_class: _default_roll_parameters(asset_class) for asset_class in _DEFAULT_ROLL_TABLE
         }
+        self._default_params_view = MappingProxyType(self._default_params)
+        self._default_fallback = self._default_params[AssetClass.EQUITY]
     
     def get_roll_config(self, instrument_code: str) -> Optional[Dict[str, Any]]:
         """
@@ -182,7 +260,7 @@ class RollConfigManager:
         """
         return self._roll_configs.get(instrument_code)
     
-    def get_default_roll_parameters(self, asset_class: AssetClass) -> Dict[str, Any]:
+    def get_default_roll_parameters(self, asset_class: AssetClass) -> Mapping[str, Any]:
         """
         Get default roll parameters for an asset class.
         
@@ -190,11 +268,11 @@ class RollConfigManager:
             asset_class: Asset class enum
             
         Returns:
-            Dictionary of default roll parameters
+            Read-only mapping of default roll parameters; use dict(...) to modify
         """
-        return self._default_params.get(asset_class, self._default_params[AssetClass.EQUITY]).copy()
+        return self._default_params.get(asset_class, self._default_fallback)
     
-    def get_instrument_roll_parameters(self, instrument_code: str, asset_class: AssetClass) -> Dict[str, Any]:
+    def get_instrument_roll_parameters(self, instrument_code: str, asset_class: AssetClass) -> Mapping[str, Any]:
         """
         Get roll parameters for a specific instrument.
         First tries to get from CSV, falls back to asset class defaults.
@@ -204,19 +282,27 @@ class RollConfigManager:
             asset_class: Asset class of the instrument
             
         Returns:
-            Dictionary of roll parameters
+            Read-only mapping of roll parameters; use dict(...) to modify
         """
         # First try to get from CSV configuration
-        csv_config = self.get_roll_config(instrument_code)
+        csv_config = self._roll_config_views.get(instrument_code)
         if csv_config:
-            return csv_config.copy()
+            return csv_config
         
         # Fall back to asset class defaults
         return self.get_default_roll_parameters(asset_class)
     
-    def get_all_roll_configs(self) -> Dict[str, Dict[str, Any]]:
-        """Get all roll configurations from CSV."""
-        return self._roll_configs.copy()
+    def get_all_roll_configs(self) -> Mapping[str, Mapping[str, Any]]:
+        """
+        Get all roll configurations from CSV.
+        
+        Returns a read-only view; use get_all_roll_configs_mutable() for a copy.
+        """
+        return self._all_roll_configs_view
+    
+    def get_all_roll_configs_mutable(self) -> Dict[str, Dict[str, Any]]:
+        """Get an independent, mutable copy of all roll configurations from CSV."""
+        return {instrument_code: dict(config) for instrument_code, config in self._roll_configs.items()}
     
     def get_instruments_by_roll_pattern(self, hold_cycle: str = None, 
                                       priced_cycle: str = None,
@@ -232,9 +318,24 @@ class RollConfigManager:
         Returns:
             List of instrument codes matching the criteria
         """
-        matches = []
+        # Start from the narrowest indexed criterion, then check the others per candidate
+        candidates = None
+        for value, index in (
+            (hold_cycle or None, self._by_hold_cycle),
+            (priced_cycle or None, self._by_priced_cycle),
+            (roll_offset_days, self._by_roll_offset),
+        ):
+            if value is not None:
+                codes = index.get(value, [])
+                if candidates is None or len(codes) < len(candidates):
+                    candidates = codes
         
-        for instrument_code, config in self._roll_configs.items():
+        if candidates is None:
+            return list(self._codes)
+        
+        matches = []
+        for instrument_code in candidates:
+            config = self._roll_configs[instrument_code]
             if hold_cycle and config['hold_cycle'] != hold_cycle:
                 continue
             if priced_cycle and config['priced_cycle'] != priced_cycle:
@@ -258,49 +359,35 @@ class RollConfigManager:
         Returns:
             List of instrument codes within the range
         """
-        matches = []
-        
-        for instrument_code, config in self._roll_configs.items():
-            offset = config['roll_offset_days']
-            
-            if min_offset is not None and offset < min_offset:
-                continue
-            if max_offset is not None and offset > max_offset:
-                continue
-            
-            matches.append(instrument_code)
+        low = 0 if min_offset is None else bisect.bisect_left(self._sorted_offsets, min_offset)
+        high = len(self._sorted_offsets) if max_offset is None else bisect.bisect_right(self._sorted_offsets, max_offset)
         
-        return matches
+        return [self._codes[position] for position in sorted(self._offset_positions[low:high])]
     
     def get_roll_statistics(self) -> Dict[str, Any]:
         """Get statistics about roll configurations."""
         if not self._roll_configs:
             return {}
         
-        offsets = [config['roll_offset_days'] for config in self._roll_configs.values()]
-        hold_cycles = [config['hold_cycle'] for config in self._roll_configs.values()]
-        priced_cycles = [config['priced_cycle'] for config in self._roll_configs.values()]
+        offsets = self._roll_frame['roll_offset_days']
+        offset_counts = Counter(offsets.tolist())
+        hold_cycle_counts = Counter(self._roll_frame['hold_cycle'].tolist())
+        priced_cycle_counts = Counter(self._roll_frame['priced_cycle'].tolist())
         
         return {
             'total_instruments': len(self._roll_configs),
             'roll_offset_stats': {
-                'min': min(offsets),
-                'max': max(offsets),
-                'mean': sum(offsets) / len(offsets),
-                'most_common': max(set(offsets), key=offsets.count)
+                'min': int(offsets.min()),
+                'max': int(offsets.max()),
+                'mean': float(offsets.mean()),
+                'most_common': offset_counts.most_common(1)[0][0]
             },
-            'unique_hold_cycles': len(set(hold_cycles)),
-            'unique_priced_cycles': len(set(priced_cycles)),
-            'common_hold_cycles': self._get_most_common(hold_cycles, 5),
-            'common_priced_cycles': self._get_most_common(priced_cycles, 5)
+            'unique_hold_cycles': len(hold_cycle_counts),
+            'unique_priced_cycles': len(priced_cycle_counts),
+            'common_hold_cycles': hold_cycle_counts.most_common(5),
+            'common_priced_cycles': priced_cycle_counts.most_common(5)
         }
     
-    def _get_most_common(self, items: List[str], n: int) -> List[tuple]:
-        """Get the n most common items with their counts."""
-        from collections import Counter
-        counter = Counter(items)
-        return counter.most_common(n)
-    
     def validate_roll_parameters(self, params: Dict[str, Any]) -> bool:
         """
         Validate roll parameters.
@@ -315,43 +402,11 @@ class RollConfigManager:
     
     def _validate_roll_parameters(self, params: Dict[str, Any]) -> bool:
         """Internal validation method."""
-        required_keys = ["hold_cycle", "priced_cycle", "roll_offset_days", "expiry_offset", "carry_offset"]
-        
-        # Check all required keys present
-        if not all(key in params for key in required_keys):
-            return False
-        
-        # Validate cycle strings
-        valid_months = "FGHJKMNQUVXZ"
-        for cycle_key in ["hold_cycle", "priced_cycle"]:
-            cycle = params[cycle_key]
-            if not isinstance(cycle, str) or not cycle:
-                return False
-            for month in cycle:
-                if month not in valid_months:
-                    return False
-        
-        # Validate offsets
-        if not isinstance(params["roll_offset_days"], int):
-            return False
-        
-        if params["roll_offset_days"] > 0:
-            return False  # Should be negative (roll before expiry)
-        
-        if abs(params["roll_offset_days"]) > 2000:
-            return False  # Reasonable limit (increased for STIR instruments)
-        
-        if not isinstance(params["carry_offset"], int):
-            return False
-        
-        if abs(params["carry_offset"]) > 12:
-            return False  # Within a year
-        
-        return True
+        return _validate_roll_parameters(params)
     
-    def get_all_default_parameters(self) -> Dict[AssetClass, Dict[str, Any]]:
-        """Get all default roll parameters by asset class."""
-        return self._default_params.copy()
+    def get_all_default_parameters(self) -> Mapping[AssetClass, Mapping[str, Any]]:
+        """Get all default roll parameters by asset class as a read-only view."""
+        return self._default_params_view
 
 
 # Special roll parameters for specific market conditions
@@ -374,9 +429,21 @@ SPECIAL_ROLL_PARAMETERS = {
     }
 }
 
+# Flattened condition -> roll offset adjustment lookup
+_CONDITION_ADJUSTMENTS = {
+    condition: params.get("roll_offset_days_adjustment", 0)
+    for condition, params in SPECIAL_ROLL_PARAMETERS.items()
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _total_adjustment(market_conditions: tuple) -> int:
+    """Sum the roll offset adjustments for a sequence of market conditions."""
+    return sum(_CONDITION_ADJUSTMENTS.get(condition, 0) for condition in market_conditions)
+
 
 def apply_market_condition_adjustments(
-    base_params: Dict[str, Any],
+    base_params: Mapping[str, Any],
     market_conditions: list
 ) -> Dict[str, Any]:
     """
@@ -387,52 +454,68 @@ def apply_market_condition_adjustments(
         market_conditions: List of market conditions to apply
         
     Returns:
-        Adjusted roll parameters
+        Adjusted roll parameters as a new dictionary
     """
-    adjusted_params = base_params.copy()
+    adjusted_params = dict(base_params)
     
-    total_adjustment = 0
-    for condition in market_conditions:
-        if condition in SPECIAL_ROLL_PARAMETERS:
-            adjustment = SPECIAL_ROLL_PARAMETERS[condition].get("roll_offset_days_adjustment", 0)
-            total_adjustment += adjustment
+    total_adjustment = _total_adjustment(tuple(market_conditions))
     
     if total_adjustment != 0:
-        adjusted_params["roll_offset_days"] += total_adjustment
-        
         # Ensure we don't go beyond reasonable limits
-        if adjusted_params["roll_offset_days"] > -1:
-            adjusted_params["roll_offset_days"] = -1
-        elif adjusted_params["roll_offset_days"] < -90:
-            adjusted_params["roll_offset_days"] = -90
+        adjusted_params["roll_offset_days"] = max(
+            -90, min(-1, adjusted_params["roll_offset_days"] + total_adjustment)
+        )
     
     return adjusted_params
 
 
-# Backward compatibility functions
-def get_default_roll_parameters(asset_class: AssetClass) -> Dict[str, Any]:
-    """Backward compatibility function."""
-    manager = RollConfigManager()
-    return manager.get_default_roll_parameters(asset_class)
+# Backward compatibility functions (served by the shared default manager)
+@functools.lru_cache(maxsize=None)
+def get_default_roll_parameters(asset_class: AssetClass) -> Mapping[str, Any]:
+    """
+    Backward compatibility function.
+    
+    Results are cached per asset class and returned as read-only mappings;
+    use dict(...) to get a mutable copy.
+    """
+    return get_default_roll_manager().get_default_roll_parameters(asset_class)
 
 
-def get_instrument_roll_parameters(instrument_code: str, asset_class: AssetClass) -> Dict[str, Any]:
-    """Backward compatibility function."""
-    manager = RollConfigManager()
-    return manager.get_instrument_roll_parameters(instrument_code, asset_class)
+@functools.lru_cache(maxsize=512)
+def get_instrument_roll_parameters(instrument_code: str, asset_class: AssetClass) -> Mapping[str, Any]:
+    """
+    Backward compatibility function.
+    
+    Results are cached per (instrument_code, asset_class) and returned as
+    read-only mappings; use dict(...) to get a mutable copy.
+    """
+    return get_default_roll_manager().get_instrument_roll_parameters(instrument_code, asset_class)
 
 
 def validate_roll_parameters(params: Dict[str, Any]) -> bool:
     """Backward compatibility function."""
-    manager = RollConfigManager()
-    return manager.validate_roll_parameters(params)
+    return get_default_roll_manager().validate_roll_parameters(params)
 
 
-def get_all_default_parameters() -> Dict[AssetClass, Dict[str, Any]]:
+def get_all_default_parameters() -> Mapping[AssetClass, Mapping[str, Any]]:
     """Backward compatibility function."""
-    manager = RollConfigManager()
-    return manager.get_all_default_parameters()
+    return get_default_roll_manager().get_all_default_parameters()
+
+
+@functools.lru_cache(maxsize=1)
+def get_default_roll_manager() -> RollConfigManager:
+    """
+    Get the shared RollConfigManager built from the packaged CSV files.
+    
+    rollconfig.csv is read on the first call rather than at import time.
+    """
+    return RollConfigManager()
 
 
-# Create a default instance for easy access
-DEFAULT_ROLL_MANAGER = RollConfigManager()
\ No newline at end of file
+def __getattr__(name: str) -> Any:
+    """Create DEFAULT_ROLL_MANAGER (kept for backward compatibility) on first access."""
+    if name == "DEFAULT_ROLL_MANAGER":
+        manager = get_default_roll_manager()
+        globals()["DEFAULT_ROLL_MANAGER"] = manager
+        return manager
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
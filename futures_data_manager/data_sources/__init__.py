@@ -1,14 +1,45 @@
 # futures_data_manager/data_sources/__init__.py
 """
 Data source modules for futures data providers.
+
+The Interactive Brokers names are imported on first access so that importing
+this package does not pull in ib_insync.
 """
 
-from futures_data_manager.data_sources.interactive_brokers import IBDataSource, IBConnectionManager, download_multiple_instruments
+from typing import TYPE_CHECKING, Any
+
 from futures_data_manager.data_sources.base_data_source import BaseDataSource
 
+if TYPE_CHECKING:
+    from futures_data_manager.data_sources.interactive_brokers import IBDataSource, IBConnectionManager, as_nested_dict, download_multiple_instruments
+
+# Lazily exported name -> defining module
+_LAZY_IMPORTS = {
+    "IBDataSource": "futures_data_manager.data_sources.interactive_brokers",
+    "IBConnectionManager": "futures_data_manager.data_sources.interactive_brokers",
+    "download_multiple_instruments": "futures_data_manager.data_sources.interactive_brokers",
+    "as_nested_dict": "futures_data_manager.data_sources.interactive_brokers",
+}
+
 __all__ = [
     "IBDataSource",
     "IBConnectionManager", 
     "download_multiple_instruments",
+    "as_nested_dict",
     "BaseDataSource"
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the Interactive Brokers exports on first access."""
+    if name in _LAZY_IMPORTS:
+        import importlib
+        
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
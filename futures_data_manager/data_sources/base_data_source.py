@@ -2,16 +2,25 @@
 Base data source class for futures data providers.
 """
 
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any
-import pandas as pd
+from typing import TYPE_CHECKING, Dict, List, Optional, Any
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class BaseDataSource(ABC):
     """
     Abstract base class for futures data sources.
+    
+    Declares no instance state of its own (empty __slots__), so subclasses
+    choose their own attribute layout.
     """
     
+    __slots__ = ()
+    
     @abstractmethod
     async def connect(self) -> bool:
         """Connect to the data source."""
@@ -3,19 +3,31 @@ Interactive Brokers data source module using ib_insync for futures data download
 """
 
 import asyncio
-from typing import Dict, List, Optional, Any
-from datetime import datetime, timedelta
+import math
+import time
+from contextlib import asynccontextmanager
+from itertools import compress
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Mapping, Optional, Any, Tuple, TypeVar, Union
+from datetime import date, datetime, timedelta
+import numpy as np
 import pandas as pd
 from loguru import logger
 
 try:
-    from ib_insync import IB, Future, util
+    from ib_insync import IB, Future
     from ib_insync.contract import Contract
 except ImportError:
     logger.error("ib_insync not installed. Please install it: pip install ib_insync")
     raise
 
+from futures_data_manager.config.instruments import get_default_config
 from futures_data_manager.data_sources.base_data_source import BaseDataSource
+from futures_data_manager.data_storage.data_objects import narrow_volume
+
+T = TypeVar("T")
+
+# Index levels of the download_multiple_instruments result
+_DOWNLOAD_INDEX_NAMES = ["instrument", "contract", "date"]
 
 
 class IBDataSource(BaseDataSource):
@@ -30,7 +42,8 @@ class IBDataSource(BaseDataSource):
         port: int = 7497,
         client_id: int = 1,
         timeout: int = 10,
-        max_requests_per_second: int = 50
+        max_requests_per_second: int = 50,
+        max_connection_retries: int = 5
     ):
         """
         Initialize IB data source.
@@ -41,6 +54,7 @@ class IBDataSource(BaseDataSource):
             client_id: Unique client ID for this connection
             timeout: Connection timeout in seconds
             max_requests_per_second: Rate limiting for API requests
+            max_connection_retries: Reconnection attempts before a dropped request fails
         """
         super().__init__()
         
@@ -49,10 +63,26 @@ class IBDataSource(BaseDataSource):
         self.client_id = client_id
         self.timeout = timeout
         self.max_requests_per_second = max_requests_per_second
+        self.max_connection_retries = max_connection_retries
         
         self.ib = IB()
         self.connected = False
-        self._request_times = []
+        self._disconnect_handler_registered = False
+        
+        # Token bucket: up to max_requests_per_second requests in a burst,
+        # refilled continuously at max_requests_per_second
+        self._capacity = float(max_requests_per_second)
+        self._refill_rate = float(max_requests_per_second)
+        self._tokens = self._capacity
+        self._last_refill = time.monotonic()
+        
+        # Qualified contracts by (instrument_code, YYYYMM) and IB specs by instrument_code
+        self._qualified_cache: Dict[Tuple[str, str], Contract] = {}
+        self._ib_specs_cache: Dict[str, Optional[Mapping[str, Any]]] = {}
+        
+        # Positive availability checks by (instrument_code, contract_month), valid for one day
+        self._availability_cache: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._availability_date: Optional[date] = None
     
     async def connect(self) -> bool:
         """Connect to Interactive Brokers TWS/Gateway."""
@@ -68,6 +98,11 @@ class IBDataSource(BaseDataSource):
             self.connected = True
             logger.success(f"Connected to IB successfully. Client ID: {self.client_id}")
             
+            # Register once; connect() is called again on every reconnect
+            if not self._disconnect_handler_registered:
+                self.ib.disconnectedEvent += self._on_disconnect
+                self._disconnect_handler_registered = True
+            
             # Verify connection
             account_summary = self.ib.accountSummary()
             logger.info(f"Account summary retrieved: {len(account_summary)} items")
@@ -84,25 +119,178 @@ class IBDataSource(BaseDataSource):
         if self.connected:
             self.ib.disconnect()
             self.connected = False
+            self.clear_contract_cache()
             logger.info("Disconnected from IB")
     
-    def _rate_limit(self) -> None:
-        """Implement rate limiting to avoid API limits."""
-        now = datetime.now()
-        
-        # Remove requests older than 1 second
-        self._request_times = [
-            req_time for req_time in self._request_times
-            if (now - req_time).total_seconds() < 1.0
-        ]
+    def clear_contract_cache(self) -> None:
+        """Forget qualified contracts so they are re-qualified on next use."""
+        self._qualified_cache.clear()
+    
+    def _on_disconnect(self) -> None:
+        """Handle the IB connection being dropped."""
+        if self.connected:
+            logger.warning("Connection to IB lost")
+        self.clear_contract_cache()
+    
+    async def _with_reconnect(
+        self,
+        coro_factory: Callable[[], Awaitable[T]],
+        *,
+        max_retries: Optional[int] = None,
+        requests: int = 1
+    ) -> T:
+        """
+        Send a rate-limited IB request, reconnecting and retrying if the connection drops.
+        
+        Args:
+            coro_factory: Callable returning a fresh request coroutine for each attempt
+            max_retries: Reconnection attempts (defaults to max_connection_retries)
+            requests: Number of IB requests the coroutine sends
+            
+        Returns:
+            Result of the request
+        """
+        if max_retries is None:
+            max_retries = self.max_connection_retries
+        
+        attempt = 0
+        while True:
+            try:
+                async with self._limit(requests):
+                    return await coro_factory()
+            except Exception as e:
+                connection_lost = isinstance(e, (ConnectionError, asyncio.TimeoutError)) or not self.ib.isConnected()
+                if not connection_lost or attempt >= max_retries:
+                    raise
+                
+                delay = 2 ** attempt
+                attempt += 1
+                logger.warning(
+                    f"IB request failed ({e}); reconnecting in {delay}s "
+                    f"(attempt {attempt}/{max_retries})"
+                )
+                await asyncio.sleep(delay)
+                if not self.ib.isConnected():
+                    await self.connect()
+    
+    async def _acquire(self, requests: int = 1) -> None:
+        """
+        Wait until requests may be sent without exceeding the API rate limit.
+        
+        Each call takes one token per request from the bucket. The tokens are
+        taken before sleeping (the balance may go negative), so concurrent
+        callers queue behind each other instead of all waking at once.
+        
+        Args:
+            requests: Number of IB requests about to be sent
+        """
+        now = time.monotonic()
+        self._tokens = min(self._capacity, self._tokens + (now - self._last_refill) * self._refill_rate)
+        self._last_refill = now
+        
+        self._tokens -= requests
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self._refill_rate)
+    
+    @asynccontextmanager
+    async def _limit(self, requests: int = 1) -> AsyncIterator[None]:
+        """Rate-limited section wrapping IB API requests (one by default)."""
+        await self._acquire(requests)
+        yield
+    
+    def _get_ib_specs(self, instrument_code: str) -> Optional[Mapping[str, Any]]:
+        """Get IB contract specifications for an instrument, memoized per instance."""
+        try:
+            return self._ib_specs_cache[instrument_code]
+        except KeyError:
+            pass
+        
+        # The shared config is loaded once per process, not once per request
+        ib_specs = get_default_config().get_ib_contract_specs(instrument_code)
+        self._ib_specs_cache[instrument_code] = ib_specs
+        return ib_specs
+    
+    async def _get_qualified_contract(
+        self,
+        instrument_code: str,
+        contract_id: str,
+        ib_specs: Mapping[str, Any]
+    ) -> Optional[Contract]:
+        """
+        Get the qualified IB contract for a contract month, qualifying it on first use.
+        
+        Args:
+            instrument_code: Internal instrument code
+            contract_id: Contract month in YYYYMM format
+            ib_specs: IB contract specifications
+            
+        Returns:
+            Qualified contract, or None if IB could not qualify it
+        """
+        key = (instrument_code, contract_id)
+        contract = self._qualified_cache.get(key)
+        if contract is not None:
+            return contract
+        
+        contract = self._create_futures_contract(instrument_code, contract_id, ib_specs)
+        qualified_contracts = await self._with_reconnect(lambda: self.ib.qualifyContractsAsync(contract))
+        if not qualified_contracts:
+            return None
+        
+        contract = qualified_contracts[0]
+        self._qualified_cache[key] = contract
+        return contract
+    
+    async def _qualify_many(self, contracts: List[Contract]) -> List[Optional[Contract]]:
+        """
+        Qualify several contracts with one qualifyContractsAsync call per batch.
         
-        # If we're at the limit, wait
-        if len(self._request_times) >= self.max_requests_per_second:
-            sleep_time = 1.0 - (now - self._request_times[0]).total_seconds()
-            if sleep_time > 0:
-                asyncio.sleep(sleep_time)
+        ib_insync still sends one contract details request per contract, all at
+        once, so each batch is at most the rate limiter's burst capacity and
+        takes one token per contract.
         
-        self._request_times.append(now)
+        Args:
+            contracts: Contracts to qualify; IB fills in their details in place
+            
+        Returns:
+            The contracts in input order, with None for any IB could not qualify
+        """
+        batch_size = max(1, int(self._capacity))
+        for start in range(0, len(contracts), batch_size):
+            batch = contracts[start:start + batch_size]
+            await self._with_reconnect(
+                lambda batch=batch: self.ib.qualifyContractsAsync(*batch), requests=len(batch)
+            )
+        return [contract if contract.conId else None for contract in contracts]
+    
+    async def qualify_contracts(self, instrument_code: str, contract_months: List[str]) -> None:
+        """
+        Qualify an instrument's contracts up front in rate-limited batches.
+        
+        The contract details requests of a batch are sent concurrently, and the
+        qualified contracts are cached, so later data requests for these months
+        skip their own qualification round trip.
+        
+        Args:
+            instrument_code: Internal instrument code
+            contract_months: Contract months (YYYYMM format)
+        """
+        ib_specs = self._get_ib_specs(instrument_code)
+        if not ib_specs:
+            return
+        
+        pending = [
+            contract_id for contract_id in dict.fromkeys(month[:6] for month in contract_months)
+            if (instrument_code, contract_id) not in self._qualified_cache
+        ]
+        contracts = [
+            self._create_futures_contract(instrument_code, contract_id, ib_specs)
+            for contract_id in pending
+        ]
+        
+        for contract_id, contract in zip(pending, await self._qualify_many(contracts)):
+            if contract is not None:
+                self._qualified_cache[(instrument_code, contract_id)] = contract
     
     def _create_futures_contract(
         self,
@@ -163,45 +351,36 @@ class IBDataSource(BaseDataSource):
             raise RuntimeError("Not connected to IB. Call connect() first.")
         
         try:
-            # Rate limiting
-            self._rate_limit()
-            
             # Get IB contract specs from instrument config
-            from futures_data_manager.config.instruments import InstrumentConfig
-            config = InstrumentConfig()
-            ib_specs = config.get_ib_contract_specs(instrument_code)
+            ib_specs = self._get_ib_specs(instrument_code)
             
             if not ib_specs:
                 raise ValueError(f"No IB specifications for instrument: {instrument_code}")
             
-            # Create contract
+            # Qualify contract to get detailed specifications (cached after the first request)
             contract_id = contract_month[:6]  # Remove '00' suffix
-            contract = self._create_futures_contract(instrument_code, contract_id, ib_specs)
-            
-            # Qualify contract to get detailed specifications
-            qualified_contracts = await self.ib.qualifyContractsAsync(contract)
-            if not qualified_contracts:
+            contract = await self._get_qualified_contract(instrument_code, contract_id, ib_specs)
+            if contract is None:
                 logger.warning(f"Could not qualify contract {instrument_code} {contract_id}")
                 return pd.DataFrame()
             
-            contract = qualified_contracts[0]
             logger.debug(f"Qualified contract: {contract}")
             
             # Calculate duration
             start_dt = datetime.strptime(start_date, "%Y%m%d")
             end_dt = datetime.strptime(end_date, "%Y%m%d")
-            duration_days = (end_dt - start_dt).days
+            duration_days = max(1, (end_dt - start_dt).days + 1)  # Inclusive of both ends
             
-            # IB duration string
+            # IB duration string; years are rounded up so the start of the range is covered
             if duration_days <= 365:
                 duration = f"{duration_days} D"
             else:
-                duration = f"{duration_days // 365} Y"
+                duration = f"{math.ceil(duration_days / 365)} Y"
             
             # Request historical data
             logger.info(f"Requesting {duration} of data for {instrument_code} {contract_id}")
             
-            bars = await self.ib.reqHistoricalDataAsync(
+            bars = await self._with_reconnect(lambda: self.ib.reqHistoricalDataAsync(
                 contract=contract,
                 endDateTime=end_date,
                 durationStr=duration,
@@ -209,24 +388,14 @@ class IBDataSource(BaseDataSource):
                 whatToShow=what_to_show,
                 useRTH=True,  # Regular trading hours only
                 formatDate=1   # Return as datetime
-            )
+            ))
             
             if not bars:
                 logger.warning(f"No data returned for {instrument_code} {contract_id}")
                 return pd.DataFrame()
             
-            # Convert to DataFrame
-            df = util.df(bars)
-            
-            if df.empty:
-                logger.warning(f"Empty DataFrame for {instrument_code} {contract_id}")
-                return df
-            
-            # Clean and format data
-            df = self._format_price_data(df)
-            
-            # Filter by date range
-            df = df.loc[start_dt:end_dt]
+            # Convert to DataFrame in standard format, dropping bars outside the date range
+            df = self._format_price_data(bars, start_dt, end_dt)
             
             logger.info(f"Downloaded {len(df)} bars for {instrument_code} {contract_id}")
             return df
@@ -235,48 +404,57 @@ class IBDataSource(BaseDataSource):
             logger.error(f"Error downloading data for {instrument_code} {contract_month}: {e}")
             return pd.DataFrame()
     
-    def _format_price_data(self, df: pd.DataFrame) -> pd.DataFrame:
+    def _format_price_data(
+        self,
+        bars: List[Any],
+        start_dt: Optional[datetime] = None,
+        end_dt: Optional[datetime] = None
+    ) -> pd.DataFrame:
         """
-        Format raw IB data to standard format.
+        Build a standard-format price DataFrame directly from IB bars.
         
         Args:
-            df: Raw DataFrame from IB
+            bars: BarData list returned by reqHistoricalDataAsync
+            start_dt: Drop bars before this time
+            end_dt: Drop bars after this time
             
         Returns:
-            Formatted DataFrame with standard column names
+            DataFrame indexed by date with float32 OHLC columns and a VOLUME
+            column that is int32 unless volume is missing or out of range
         """
-        if df.empty:
-            return df
+        dates = np.fromiter((bar.date for bar in bars), dtype="datetime64[ns]", count=len(bars))
         
-        # Rename columns to standard format
-        column_mapping = {
-            "open": "OPEN",
-            "high": "HIGH", 
-            "low": "LOW",
-            "close": "CLOSE",
-            "volume": "VOLUME"
-        }
+        # Trim bars IB returned outside the requested range before converting prices
+        in_range = np.ones(len(dates), dtype=bool)
+        if start_dt is not None:
+            in_range &= dates >= np.datetime64(start_dt, "ns")
+        if end_dt is not None:
+            in_range &= dates <= np.datetime64(end_dt, "ns")
+        if not in_range.all():
+            bars = list(compress(bars, in_range))
+            dates = dates[in_range]
         
-        df = df.rename(columns=column_mapping)
-        
-        # Ensure datetime index
-        if "date" in df.columns:
-            df = df.set_index("date")
-        
-        # Convert to numeric
-        price_columns = ["OPEN", "HIGH", "LOW", "CLOSE"]
-        for col in price_columns:
-            if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors="coerce")
-        
-        if "VOLUME" in df.columns:
-            df["VOLUME"] = pd.to_numeric(df["VOLUME"], errors="coerce").fillna(0)
+        count = len(bars)
+        ohlc = np.empty((count, 4), dtype=np.float32)
+        for i, attr in enumerate(("open", "high", "low", "close")):
+            ohlc[:, i] = np.fromiter((getattr(bar, attr) for bar in bars), dtype=np.float32, count=count)
+        volume = np.fromiter((bar.volume for bar in bars), dtype=np.float64, count=count)
         
         # Remove any rows with all NaN prices
-        df = df.dropna(subset=price_columns, how="all")
+        keep = ~np.isnan(ohlc).all(axis=1)
+        if not keep.all():
+            dates, ohlc, volume = dates[keep], ohlc[keep], volume[keep]
+        
+        df = pd.DataFrame(ohlc, index=pd.DatetimeIndex(dates, name="date"), columns=["OPEN", "HIGH", "LOW", "CLOSE"])
         
         # Forward fill missing prices (common for low-volume contracts)
-        df[price_columns] = df[price_columns].fillna(method="ffill")
+        df.ffill(inplace=True)
+        
+        # Ensure OHLC consistency so storage can skip re-validating this data
+        ohlc = df.to_numpy()
+        df["HIGH"] = np.fmax.reduce(ohlc, axis=1)
+        df["LOW"] = np.fmin.reduce(ohlc, axis=1)
+        df["VOLUME"] = narrow_volume(volume)
         
         return df
     
@@ -300,24 +478,19 @@ class IBDataSource(BaseDataSource):
         
         try:
             # Get IB contract specs
-            from futures_data_manager.config.instruments import InstrumentConfig
-            config = InstrumentConfig()
-            ib_specs = config.get_ib_contract_specs(instrument_code)
+            ib_specs = self._get_ib_specs(instrument_code)
             
             if not ib_specs:
                 return None
             
             # Create and qualify contract
-            contract = self._create_futures_contract(instrument_code, contract_month, ib_specs)
-            qualified_contracts = await self.ib.qualifyContractsAsync(contract)
+            contract = await self._get_qualified_contract(instrument_code, contract_month[:6], ib_specs)
             
-            if not qualified_contracts:
+            if contract is None:
                 return None
             
-            contract = qualified_contracts[0]
-            
             # Get contract details
-            details = await self.ib.reqContractDetailsAsync(contract)
+            details = await self._with_reconnect(lambda: self.ib.reqContractDetailsAsync(contract))
             
             if not details:
                 return None
@@ -362,9 +535,7 @@ class IBDataSource(BaseDataSource):
         
         try:
             # Get IB contract specs
-            from futures_data_manager.config.instruments import InstrumentConfig
-            config = InstrumentConfig()
-            ib_specs = config.get_ib_contract_specs(instrument_code)
+            ib_specs = self._get_ib_specs(instrument_code)
             
             if not ib_specs:
                 return []
@@ -377,7 +548,7 @@ class IBDataSource(BaseDataSource):
             )
             
             # Get contract details for all available months
-            details = await self.ib.reqContractDetailsAsync(contract)
+            details = await self._with_reconnect(lambda: self.ib.reqContractDetailsAsync(contract))
             
             # Extract contract months and sort
             contract_months = []
@@ -412,10 +583,21 @@ class IBDataSource(BaseDataSource):
         Returns:
             Dictionary with availability information
         """
+        # Every check on the same day requests the same window, so its result can be reused
+        today = date.today()
+        if today != self._availability_date:
+            self._availability_cache.clear()
+            self._availability_date = today
+        
+        key = (instrument_code, contract_month)
+        cached = self._availability_cache.get(key)
+        if cached is not None:
+            return dict(cached)
+        
         try:
             # Try to get a small sample of recent data
-            end_date = datetime.now().strftime("%Y%m%d")
-            start_date = (datetime.now() - timedelta(days=7)).strftime("%Y%m%d")
+            end_date = today.strftime("%Y%m%d")
+            start_date = (today - timedelta(days=7)).strftime("%Y%m%d")
             
             sample_data = await self.get_historical_data(
                 instrument_code=instrument_code,
@@ -424,13 +606,19 @@ class IBDataSource(BaseDataSource):
                 end_date=end_date
             )
             
-            return {
+            availability = {
                 "available": not sample_data.empty,
                 "last_date": sample_data.index[-1] if not sample_data.empty else None,
                 "data_points": len(sample_data),
                 "sample_price": sample_data["CLOSE"].iloc[-1] if not sample_data.empty else None
             }
             
+            # Failed downloads also come back empty, so only positive results are reused
+            if availability["available"]:
+                self._availability_cache[key] = availability
+                return dict(availability)
+            return availability
+            
         except Exception as e:
             logger.error(f"Error checking data availability for {instrument_code} {contract_month}: {e}")
             return {"available": False, "error": str(e)}
@@ -457,8 +645,10 @@ async def download_multiple_instruments(
     start_date: str,
     end_date: str,
     ib_source: IBDataSource,
-    max_concurrent: int = 5
-) -> Dict[str, Dict[str, pd.DataFrame]]:
+    max_concurrent: int = 5,
+    max_concurrent_contracts: int = 5,
+    as_frame: bool = False
+) -> Union[Dict[str, Dict[str, pd.DataFrame]], pd.DataFrame]:
     """
     Download data for multiple instruments concurrently.
     
@@ -468,47 +658,113 @@ async def download_multiple_instruments(
         end_date: End date (YYYYMMDD)
         ib_source: Connected IB data source
         max_concurrent: Maximum concurrent downloads
+        max_concurrent_contracts: Maximum concurrent contract requests per instrument
+        as_frame: Return a single DataFrame indexed by (instrument, contract, date)
+            instead of the nested dictionary
         
     Returns:
-        Dictionary mapping instrument -> contract -> DataFrame
+        Dictionary mapping instrument -> contract -> DataFrame, or one
+        DataFrame of all bars when as_frame is True, with categorical
+        instrument and contract index levels
     """
     semaphore = asyncio.Semaphore(max_concurrent)
     
     async def download_instrument(instrument_code: str):
         async with semaphore:
             try:
-                # Get active contracts
+                # Get active contracts and qualify them up front in rate-limited batches
                 contracts = await ib_source.get_active_contracts(instrument_code)
+                try:
+                    await ib_source.qualify_contracts(instrument_code, contracts)
+                except Exception as e:
+                    # Each contract falls back to qualifying itself
+                    logger.warning(f"Batch qualification failed for {instrument_code}: {e}")
+                
+                # Download the contracts concurrently; the data source's rate
+                # limiter still paces the underlying IB requests
+                contract_semaphore = asyncio.Semaphore(max_concurrent_contracts)
+                
+                async def download_contract(contract_month: str) -> pd.DataFrame:
+                    async with contract_semaphore:
+                        return await ib_source.get_historical_data(
+                            instrument_code=instrument_code,
+                            contract_month=contract_month + "00",
+                            start_date=start_date,
+                            end_date=end_date
+                        )
                 
-                # Download each contract
-                contract_data = {}
-                for contract_month in contracts:
-                    data = await ib_source.get_historical_data(
-                        instrument_code=instrument_code,
-                        contract_month=contract_month + "00",
-                        start_date=start_date,
-                        end_date=end_date
-                    )
-                    if not data.empty:
-                        contract_data[contract_month] = data
+                results = await asyncio.gather(
+                    *(download_contract(contract_month) for contract_month in contracts),
+                    return_exceptions=True
+                )
                 
-                return instrument_code, contract_data
+                contract_months = []
+                frames = []
+                for contract_month, data in zip(contracts, results):
+                    if isinstance(data, Exception):
+                        logger.error(f"Error downloading {instrument_code} {contract_month}: {data}")
+                    elif not data.empty:
+                        contract_months.append(contract_month)
+                        frames.append(data)
+                
+                if not frames:
+                    return instrument_code, None
+                return instrument_code, pd.concat(frames, keys=contract_months, names=["contract", "date"])
                 
             except Exception as e:
                 logger.error(f"Error downloading {instrument_code}: {e}")
-                return instrument_code, {}
+                return instrument_code, None
     
     # Start all downloads
     tasks = [download_instrument(instrument) for instrument in instruments]
     results = await asyncio.gather(*tasks, return_exceptions=True)
     
-    # Collect results
-    all_data = {}
+    # Collect results into one frame; concatenating once at the end avoids
+    # repeated copies, and the MultiIndex stores each key once as a level
+    downloaded_codes = []
+    instrument_codes = []
+    frames = []
     for result in results:
         if isinstance(result, tuple):
-            instrument_code, contract_data = result
-            all_data[instrument_code] = contract_data
+            instrument_code, instrument_data = result
+            downloaded_codes.append(instrument_code)
+            if instrument_data is not None:
+                instrument_codes.append(instrument_code)
+                frames.append(instrument_data)
         else:
             logger.error(f"Download task failed: {result}")
     
-    return all_data
\ No newline at end of file
+    if frames:
+        all_data = pd.concat(frames, keys=instrument_codes, names=["instrument"])
+    else:
+        all_data = pd.DataFrame(index=pd.MultiIndex.from_arrays([[], [], []], names=_DOWNLOAD_INDEX_NAMES))
+    
+    # Store the repeated instrument and contract labels as categoricals
+    all_data.index = all_data.index.set_levels(
+        [pd.CategoricalIndex(all_data.index.levels[level]) for level in (0, 1)],
+        level=["instrument", "contract"]
+    )
+    
+    if as_frame:
+        return all_data
+    
+    # Instruments without any data still get an (empty) entry
+    nested: Dict[str, Dict[str, pd.DataFrame]] = {instrument_code: {} for instrument_code in downloaded_codes}
+    nested.update(as_nested_dict(all_data))
+    return nested
+
+
+def as_nested_dict(data: pd.DataFrame) -> Dict[str, Dict[str, pd.DataFrame]]:
+    """
+    Split a download_multiple_instruments(as_frame=True) result into per-contract frames.
+    
+    Args:
+        data: DataFrame indexed by (instrument, contract, date)
+        
+    Returns:
+        Dictionary mapping instrument -> contract -> DataFrame indexed by date
+    """
+    nested: Dict[str, Dict[str, pd.DataFrame]] = {}
+    for (instrument_code, contract_month), frame in data.groupby(level=["instrument", "contract"], sort=False, observed=True):
+        nested.setdefault(instrument_code, {})[contract_month] = frame.droplevel(["instrument", "contract"])
+    return nested
\ No newline at end of file
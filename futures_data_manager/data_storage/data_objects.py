@@ -2,14 +2,45 @@
 Data objects for representing different types of futures data.
 """
 
-import math
-from dataclasses import dataclass
-from typing import Dict, List, Optional, Any
+from dataclasses import field
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
+import numpy as np
 import pandas as pd
 
+from futures_data_manager.utils.dataclass_utils import slotted_dataclass
 
-@dataclass
+
+_OHLC_COLUMNS = ("OPEN", "HIGH", "LOW", "CLOSE")
+_ROLL_CALENDAR_COLUMNS = ["current_contract", "next_contract", "carry_contract"]
+
+_INT32_INFO = np.iinfo(np.int32)
+
+
+def narrow_volume(volume):
+    """
+    Convert volume to int32 when that loses nothing.
+    
+    Volume with missing or fractional values, or values outside the int32
+    range, is returned unchanged rather than being filled or wrapped.
+    
+    Args:
+        volume: Volume Series or array
+        
+    Returns:
+        The volume as int32, or the input itself
+    """
+    values = np.asarray(volume)
+    if values.dtype == np.int32 or values.dtype.kind not in "iuf" or values.size == 0:
+        return volume
+    if values.dtype.kind == "f" and not (np.isfinite(values).all() and (values == np.trunc(values)).all()):
+        return volume
+    if values.min() < _INT32_INFO.min or values.max() > _INT32_INFO.max:
+        return volume
+    return volume.astype(np.int32)
+
+
+@slotted_dataclass
 class ContractSpec:
     """Specification for a futures contract."""
     instrument_code: str
@@ -23,11 +54,18 @@ class ContractSpec:
     last_trading_date: Optional[datetime] = None
 
 
-@dataclass
+@slotted_dataclass
 class RollCalendar:
     """Roll calendar data structure."""
     instrument_code: str
-    roll_dates: pd.DataFrame  # Index: dates, Columns: current_contract, next_contract, carry_contract
+    _roll_dates: pd.DataFrame = field(init=False)  # Index: dates, Columns: current_contract, next_contract, carry_contract
+    _pending: List[Tuple[datetime, str, str, str]] = field(init=False, repr=False, compare=False)
+    
+    def __init__(self, instrument_code: str, roll_dates: pd.DataFrame):
+        # Written out because roll_dates is a property over _roll_dates, which
+        # the generated __init__ cannot take as an argument
+        self.instrument_code = instrument_code
+        self._set_roll_dates(roll_dates)
     
     def add_roll(
         self,
@@ -37,33 +75,60 @@ class RollCalendar:
         carry_contract: str
     ) -> None:
         """Add a roll to the calendar."""
-        new_row = pd.DataFrame({
-            "current_contract": [current_contract],
-            "next_contract": [next_contract],
-            "carry_contract": [carry_contract]
-        }, index=[roll_date])
-        
-        self.roll_dates = pd.concat([self.roll_dates, new_row]).sort_index()
+        # Buffered until roll_dates is next read, so building a calendar stays linear
+        self._pending.append((roll_date, current_contract, next_contract, carry_contract))
     
     def get_contracts_on_date(self, date: datetime) -> Optional[Dict[str, str]]:
         """Get contract specifications for a given date."""
-        if self.roll_dates.empty:
+        roll_dates = self.roll_dates
+        if roll_dates.empty:
             return None
         
-        # Find the appropriate row
-        valid_dates = self.roll_dates.index <= date
-        if not valid_dates.any():
+        # Find the last roll on or before the date (the index is kept sorted)
+        position = roll_dates.index.searchsorted(pd.Timestamp(date), side="right") - 1
+        if position < 0:
             return None
         
-        row = self.roll_dates.loc[valid_dates].iloc[-1]
+        get_column = roll_dates.columns.get_loc
         return {
-            "current": row["current_contract"],
-            "next": row["next_contract"], 
-            "carry": row["carry_contract"]
+            "current": roll_dates.iat[position, get_column("current_contract")],
+            "next": roll_dates.iat[position, get_column("next_contract")], 
+            "carry": roll_dates.iat[position, get_column("carry_contract")]
         }
+    
+    @property
+    def roll_dates(self) -> pd.DataFrame:
+        """Roll dates with any rolls added since the last read merged in."""
+        if self._pending:
+            dates, current, next_, carry = zip(*self._pending)
+            new_rolls = pd.DataFrame({
+                "current_contract": current,
+                "next_contract": next_,
+                "carry_contract": carry
+            }, index=list(dates))
+            
+            if self._roll_dates.empty:
+                merged = new_rolls
+            else:
+                merged = pd.concat([self._roll_dates, new_rolls])
+            self._roll_dates = merged.sort_index(kind="mergesort")
+            self._pending = []
+        
+        return self._roll_dates
+    
+    @roll_dates.setter
+    def roll_dates(self, roll_dates: pd.DataFrame) -> None:
+        self._set_roll_dates(roll_dates)
+    
+    def _set_roll_dates(self, roll_dates: pd.DataFrame) -> None:
+        # Sorted once here so get_contracts_on_date can binary search the index
+        if not roll_dates.index.is_monotonic_increasing:
+            roll_dates = roll_dates.sort_index(kind="mergesort")
+        self._roll_dates = roll_dates
+        self._pending = []
 
 
-@dataclass
+@slotted_dataclass
 class PriceData:
     """Container for price data."""
     instrument_code: str
@@ -71,6 +136,19 @@ class PriceData:
     prices: pd.DataFrame  # OHLCV data
     metadata: Dict[str, Any]
     
+    def __post_init__(self) -> None:
+        # float32 OHLC and, where lossless, int32 volume, matching the contract
+        # prices parquet schema. astype returns a new frame, so the caller's
+        # DataFrame keeps its dtypes.
+        prices = self.prices
+        dtypes = {col: np.float32 for col in _OHLC_COLUMNS if col in prices.columns}
+        if "VOLUME" in prices.columns:
+            volume = narrow_volume(prices["VOLUME"])
+            if volume.dtype == np.int32:
+                dtypes["VOLUME"] = np.int32
+        if dtypes:
+            self.prices = prices.astype(dtypes)
+    
     @property
     def start_date(self) -> Optional[datetime]:
         """Get start date of price data."""
@@ -87,7 +165,7 @@ class PriceData:
         return self.prices["CLOSE"] if "CLOSE" in self.prices.columns else pd.Series()
 
 
-@dataclass
+@slotted_dataclass
 class MultiplePrices:
     """Multiple prices data structure."""
     instrument_code: str
@@ -96,20 +174,35 @@ class MultiplePrices:
     @property
     def current_prices(self) -> pd.Series:
         """Get current contract prices."""
-        return self.prices["PRICE"] if "PRICE" in self.prices.columns else pd.Series()
+        return self.prices["PRICE"] if "PRICE" in self.prices.columns else pd.Series(dtype=np.float64)
     
     @property
     def forward_prices(self) -> pd.Series:
         """Get forward contract prices."""
-        return self.prices["FORWARD"] if "FORWARD" in self.prices.columns else pd.Series()
+        return self.prices["FORWARD"] if "FORWARD" in self.prices.columns else pd.Series(dtype=np.float64)
     
     @property
     def carry_prices(self) -> pd.Series:
         """Get carry contract prices."""
-        return self.prices["CARRY"] if "CARRY" in self.prices.columns else pd.Series()
+        return self.prices["CARRY"] if "CARRY" in self.prices.columns else pd.Series(dtype=np.float64)
+    
+    @property
+    def price_arr(self) -> np.ndarray:
+        """Get current contract prices as an array."""
+        return self.current_prices.to_numpy()
+    
+    @property
+    def forward_arr(self) -> np.ndarray:
+        """Get forward contract prices as an array."""
+        return self.forward_prices.to_numpy()
+    
+    @property
+    def carry_arr(self) -> np.ndarray:
+        """Get carry contract prices as an array."""
+        return self.carry_prices.to_numpy()
 
 
-@dataclass
+@slotted_dataclass
 class AdjustedPrices:
     """Back-adjusted continuous price series."""
     instrument_code: str
@@ -124,10 +217,11 @@ class AdjustedPrices:
     @property
     def log_returns(self) -> pd.Series:
         """Calculate log returns from adjusted prices."""
-        return (self.prices / self.prices.shift(1)).apply(lambda x: math.log(x) if x > 0 else float('nan')).dropna()
+        ratio = self.prices / self.prices.shift(1)
+        return np.log(ratio.where(ratio > 0)).dropna()
 
 
-@dataclass  
+@slotted_dataclass
 class InstrumentData:
     """Complete data set for a futures instrument."""
     instrument_code: str
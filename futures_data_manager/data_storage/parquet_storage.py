@@ -3,14 +3,72 @@ Parquet storage module for efficient storage and retrieval of futures price data
 """
 
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Union
+from typing import Dict, List, Optional, Any, Tuple, Union
 from datetime import datetime
+import numpy as np
 import pandas as pd
 import pyarrow as pa
+import pyarrow.dataset as pa_ds
 import pyarrow.parquet as pq
 from loguru import logger
 
+from futures_data_manager.data_storage.data_objects import narrow_volume
+
+
+# Arrow types for the known price columns. Building write schemas from this
+# table avoids pandas' per-call schema inference in ``DataFrame.to_parquet``.
+_FIELD_TYPES = {
+    "OPEN": pa.float64(),
+    "HIGH": pa.float64(),
+    "LOW": pa.float64(),
+    "CLOSE": pa.float64(),
+    "VOLUME": pa.float64(),
+    "PRICE": pa.float64(),
+    "FORWARD": pa.float64(),
+    "CARRY": pa.float64(),
+    "PRICE_CONTRACT": pa.string(),
+    "FORWARD_CONTRACT": pa.string(),
+    "CARRY_CONTRACT": pa.string(),
+}
+
+# Raw contract OHLCV is stored as FLOAT, with ample precision for futures
+# prices at half the size of DOUBLE. VOLUME is INT32 when every value fits and
+# otherwise keeps the type of the data being written.
+_CONTRACT_FIELD_TYPES = {
+    **_FIELD_TYPES,
+    "OPEN": pa.float32(),
+    "HIGH": pa.float32(),
+    "LOW": pa.float32(),
+    "CLOSE": pa.float32(),
+    "VOLUME": pa.int32(),
+}
+
+# Contract-id columns repeat heavily, so they are written dictionary-encoded
+_DICTIONARY_COLUMNS = ("PRICE_CONTRACT", "FORWARD_CONTRACT", "CARRY_CONTRACT")
+
+# ZSTD level 1 compresses noticeably better than snappy at similar decode speed
+DEFAULT_COMPRESSION = "zstd"
+DEFAULT_COMPRESSION_LEVEL = 1
+
+# Last generated write timestamp as (monotonic time, ISO string)
+_last_iso = (float("-inf"), "")
+
+
+def _now_iso() -> str:
+    """Return the current time in ISO format, reusing the value for up to a second."""
+    global _last_iso
+    now = time.monotonic()
+    last = _last_iso
+    if now - last[0] < 1.0:
+        return last[1]
+    
+    iso = datetime.now().isoformat()
+    _last_iso = (now, iso)
+    return iso
+
 
 class ParquetStorage:
     """
@@ -18,9 +76,10 @@ class ParquetStorage:
     
     Organizes data into a structured directory layout:
     - contract_prices/: Individual futures contract OHLCV data
+    - consolidated_prices/: All contracts of an instrument in one file
     - multiple_prices/: Current/Forward/Carry price series
     - adjusted_prices/: Back-adjusted continuous series
-    - roll_calendars/: Roll date schedules (CSV format)
+    - roll_calendars/: Roll date schedules (parquet, with CSV copies)
     - fx_data/: Spot FX rates for currency conversion
     """
     
@@ -36,17 +95,48 @@ class ParquetStorage:
         
         # Directory paths
         self.contract_prices_path = self.base_path / "contract_prices"
+        self.consolidated_prices_path = self.base_path / "consolidated_prices"
         self.multiple_prices_path = self.base_path / "multiple_prices"
         self.adjusted_prices_path = self.base_path / "adjusted_prices"
         self.roll_calendars_path = self.base_path / "roll_calendars"
         self.fx_data_path = self.base_path / "fx_data"
         
+        # String form of the contract directory for per-contract file operations
+        self._contract_prices_str = str(self.contract_prices_path)
+        
+        # Canonical write schemas, plus caches for other column layouts
+        self._ohlcv_schema = pa.schema(
+            [(col, _CONTRACT_FIELD_TYPES[col]) for col in ("OPEN", "HIGH", "LOW", "CLOSE", "VOLUME")]
+        )
+        self._multiple_prices_schema = pa.schema(
+            [(col, _FIELD_TYPES[col]) for col in (
+                "PRICE", "FORWARD", "CARRY",
+                "PRICE_CONTRACT", "FORWARD_CONTRACT", "CARRY_CONTRACT"
+            )]
+        )
+        self._adjusted_prices_schema = pa.schema([("PRICE", _FIELD_TYPES["PRICE"])])
+        self._schema_cache: Dict[tuple, Optional[pa.Schema]] = {
+            tuple(schema.names): schema
+            for schema in (
+                self._multiple_prices_schema,
+                self._adjusted_prices_schema,
+            )
+        }
+        self._contract_schema_cache: Dict[tuple, Optional[pa.Schema]] = {
+            tuple(self._ohlcv_schema.names): self._ohlcv_schema
+        }
+        
+        # Directory listings keyed on the directory's st_mtime_ns
+        self._contracts_cache: Dict[str, Tuple[int, List[str]]] = {}
+        self._instruments_cache: Optional[Tuple[int, List[str]]] = None
+        
         logger.info(f"Initialized ParquetStorage at {base_path}")
     
     def _create_directory_structure(self) -> None:
         """Create the required directory structure."""
         directories = [
             "contract_prices",
+            "consolidated_prices",
             "multiple_prices",
             "adjusted_prices", 
             "roll_calendars",
@@ -55,8 +145,113 @@ class ParquetStorage:
             "temp"
         ]
         
+        base = str(self.base_path)
         for directory in directories:
-            (self.base_path / directory).mkdir(parents=True, exist_ok=True)
+            path = os.path.join(base, directory)
+            if not os.path.isdir(path):
+                os.makedirs(path, exist_ok=True)
+    
+    def _get_schema(self, columns: List[str], contract_prices: bool = False) -> Optional[pa.Schema]:
+        """
+        Get the Arrow schema for a column layout, or None if any column is unknown.
+        
+        Schemas are cached by column layout so repeated writes skip inference.
+        Raw contract OHLCV uses the narrower contract field types.
+        """
+        if contract_prices:
+            cache, field_types = self._contract_schema_cache, _CONTRACT_FIELD_TYPES
+        else:
+            cache, field_types = self._schema_cache, _FIELD_TYPES
+        
+        key = tuple(columns)
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+        
+        if all(col in field_types for col in key):
+            schema = pa.schema([(col, field_types[col]) for col in key])
+        else:
+            schema = None
+        
+        cache[key] = schema
+        return schema
+    
+    def _get_contract_schema(self, data: pd.DataFrame) -> Optional[pa.Schema]:
+        """
+        Get the write schema for contract OHLCV data.
+        
+        VOLUME is written as INT32 only when the data holds int32 volume;
+        anything else keeps its own type rather than being filled or wrapped.
+        """
+        schema = self._get_schema(list(data.columns), contract_prices=True)
+        if schema is None or "VOLUME" not in data.columns:
+            return schema
+        
+        dtype = data["VOLUME"].dtype
+        if dtype == np.int32:
+            return schema
+        volume_type = pa.from_numpy_dtype(dtype) if dtype.kind in "iuf" else pa.float64()
+        return schema.set(schema.get_field_index("VOLUME"), pa.field("VOLUME", volume_type))
+    
+    @staticmethod
+    def read_file_metadata(filepath: Union[str, Path]) -> Dict[str, str]:
+        """
+        Read the key/value metadata stored in a parquet file's footer.
+        
+        Only the footer is read; the pandas schema entry is omitted.
+        """
+        raw = pq.read_metadata(filepath).metadata or {}
+        return {
+            key.decode(): value.decode()
+            for key, value in raw.items()
+            if key != b"pandas"
+        }
+    
+    def _write_table(
+        self,
+        data: pd.DataFrame,
+        filepath: Union[str, Path],
+        compression: str,
+        compression_level: Optional[int] = None,
+        metadata: Optional[Dict[str, str]] = None,
+        schema: Optional[pa.Schema] = None
+    ) -> None:
+        """
+        Convert a DataFrame to an Arrow table and write it with pyarrow directly.
+        
+        Any metadata is added to the file's key/value metadata alongside the
+        pandas schema metadata. The schema defaults to the cached one for the
+        frame's column layout.
+        """
+        columns = list(data.columns)
+        if schema is None:
+            schema = self._get_schema(columns)
+        if schema is not None:
+            # from_pandas only writes index columns that the schema lists
+            for level, name in enumerate(data.index.names):
+                index_type = pa.array(data.index.get_level_values(level)[:0]).type
+                schema = schema.append(pa.field(name if name is not None else f"__index_level_{level}__", index_type))
+        table = pa.Table.from_pandas(data, schema=schema, preserve_index=True)
+        if metadata:
+            combined = dict(table.schema.metadata or {})
+            combined.update({key.encode(): value.encode() for key, value in metadata.items()})
+            table = table.replace_schema_metadata(combined)
+        dictionary_columns = [col for col in _DICTIONARY_COLUMNS if col in columns]
+        if compression_level is not None and not pa.Codec.supports_compression_level(compression):
+            # e.g. snappy has no levels; pyarrow rejects a level for such codecs
+            compression_level = None
+        # Listing columns limits dictionary encoding to them; otherwise keep
+        # pyarrow's default of dictionary-encoding every column
+        options = {"use_dictionary": dictionary_columns} if dictionary_columns else {}
+        pq.write_table(
+            table,
+            filepath,
+            compression=compression,
+            compression_level=compression_level,
+            write_statistics=True,
+            **options
+        )
     
     # Contract Prices Storage
     
@@ -65,7 +260,9 @@ class ParquetStorage:
         instrument_code: str,
         contract_id: str,
         data: pd.DataFrame,
-        compression: str = "snappy"
+        compression: str = DEFAULT_COMPRESSION,
+        compression_level: Optional[int] = DEFAULT_COMPRESSION_LEVEL,
+        presanitized: bool = False
     ) -> None:
         """
         Store individual futures contract price data.
@@ -75,6 +272,9 @@ class ParquetStorage:
             contract_id: Contract identifier (e.g., '20240315')
             data: OHLCV DataFrame with datetime index
             compression: Parquet compression method
+            compression_level: Codec-specific compression level
+            presanitized: Skip validation when the caller guarantees a
+                DatetimeIndex, numeric OHLC columns and consistent HIGH/LOW
         """
         if data.empty:
             logger.warning(f"Empty data for {instrument_code} {contract_id}, not writing")
@@ -82,23 +282,30 @@ class ParquetStorage:
         
         try:
             # Validate data format
-            data = self._validate_price_data(data)
+            if not presanitized:
+                data = self._validate_price_data(data)
+            
+            # Volume is narrowed to int32 only when no value would change
+            if "VOLUME" in data.columns:
+                volume = narrow_volume(data["VOLUME"])
+                if volume is not data["VOLUME"]:
+                    data = data.assign(VOLUME=volume)
             
             # Create filename
             filename = f"{instrument_code}_{contract_id}.parquet"
-            filepath = self.contract_prices_path / filename
+            filepath = os.path.join(self._contract_prices_str, filename)
             
-            # Add metadata
-            data.attrs["instrument_code"] = instrument_code
-            data.attrs["contract_id"] = contract_id
-            data.attrs["last_updated"] = datetime.now().isoformat()
+            # Metadata is stored in the parquet footer
+            metadata = {
+                "instrument_code": instrument_code,
+                "contract_id": contract_id,
+                "last_updated": _now_iso()
+            }
             
             # Write to parquet
-            data.to_parquet(
-                filepath,
-                compression=compression,
-                index=True,
-                engine="pyarrow"
+            self._write_table(
+                data, filepath, compression, compression_level, metadata,
+                schema=self._get_contract_schema(data)
             )
             
             logger.debug(f"Wrote {len(data)} rows to {filepath}")
@@ -110,7 +317,8 @@ class ParquetStorage:
     def read_contract_prices(
         self,
         instrument_code: str,
-        contract_id: str
+        contract_id: str,
+        columns: Optional[List[str]] = None
     ) -> pd.DataFrame:
         """
         Read individual futures contract price data.
@@ -118,19 +326,20 @@ class ParquetStorage:
         Args:
             instrument_code: Instrument identifier
             contract_id: Contract identifier
+            columns: Optional subset of columns to load (e.g. ['CLOSE'])
             
         Returns:
             OHLCV DataFrame
         """
         filename = f"{instrument_code}_{contract_id}.parquet"
-        filepath = self.contract_prices_path / filename
+        filepath = os.path.join(self._contract_prices_str, filename)
         
-        if not filepath.exists():
+        if not os.path.isfile(filepath):
             logger.warning(f"Contract prices file not found: {filepath}")
             return pd.DataFrame()
         
         try:
-            data = pd.read_parquet(filepath, engine="pyarrow")
+            data = pd.read_parquet(filepath, engine="pyarrow", columns=columns)
             logger.debug(f"Read {len(data)} rows from {filepath}")
             return data
             
@@ -138,26 +347,221 @@ class ParquetStorage:
             logger.error(f"Error reading contract prices from {filepath}: {e}")
             return pd.DataFrame()
     
+    def read_all_contracts(
+        self,
+        instrument_code: str,
+        columns: Optional[List[str]] = None
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Read every stored contract for an instrument through one dataset.
+        
+        Args:
+            instrument_code: Instrument identifier
+            columns: Optional subset of price columns to load
+            
+        Returns:
+            Dictionary mapping contract_id to OHLCV DataFrame
+        """
+        contract_ids = self.list_contracts(instrument_code)
+        if not contract_ids:
+            return {}
+        
+        files = [
+            os.path.join(self._contract_prices_str, f"{instrument_code}_{contract_id}.parquet")
+            for contract_id in contract_ids
+        ]
+        contract_by_filename = {
+            os.path.basename(path): contract_id for path, contract_id in zip(files, contract_ids)
+        }
+        
+        contracts = {}
+        try:
+            dataset = pa_ds.dataset(files, format="parquet")
+            
+            # Each fragment is matched to its contract by file name and read with
+            # its own schema, so older files with wider types still load
+            for fragment in dataset.get_fragments():
+                schema = fragment.physical_schema
+                read_columns = None
+                if columns is not None:
+                    # Keep the stored index columns so to_pandas can restore them
+                    pandas_metadata = schema.pandas_metadata or {}
+                    index_columns = [
+                        col for col in pandas_metadata.get("index_columns", [])
+                        if isinstance(col, str) and col not in columns
+                    ]
+                    read_columns = list(columns) + index_columns
+                
+                table = fragment.to_table(schema=schema, columns=read_columns)
+                contract_id = contract_by_filename[os.path.basename(fragment.path)]
+                contracts[contract_id] = table.to_pandas(split_blocks=True, self_destruct=True)
+                del table
+            
+        except Exception as e:
+            # Fall back to reading file by file; errors there propagate rather
+            # than being mistaken for missing data
+            logger.warning(f"Dataset scan failed for {instrument_code} ({e}); reading contracts individually")
+            contracts = {
+                contract_id: pd.read_parquet(path, engine="pyarrow", columns=columns)
+                for path, contract_id in zip(files, contract_ids)
+            }
+        
+        contracts = {contract_id: contracts[contract_id] for contract_id in contract_ids}
+        logger.debug(
+            f"Read {sum(map(len, contracts.values()))} rows across {len(contracts)} contracts for {instrument_code}"
+        )
+        return contracts
+    
     def contract_exists(self, instrument_code: str, contract_id: str) -> bool:
         """Check if contract data exists."""
         filename = f"{instrument_code}_{contract_id}.parquet"
-        filepath = self.contract_prices_path / filename
-        return filepath.exists()
+        filepath = os.path.join(self._contract_prices_str, filename)
+        return os.path.isfile(filepath)
     
     def list_contracts(self, instrument_code: str) -> List[str]:
-        """List all available contracts for an instrument."""
-        pattern = f"{instrument_code}_*.parquet"
-        files = list(self.contract_prices_path.glob(pattern))
+        """
+        List all available contracts for an instrument.
+        
+        The listing is cached until the contract_prices directory changes.
+        """
+        mtime = self.contract_prices_path.stat().st_mtime_ns
+        cached = self._contracts_cache.get(instrument_code)
+        if cached is not None and cached[0] == mtime:
+            return list(cached[1])
+        
+        prefix = f"{instrument_code}_"
+        files = self.contract_prices_path.glob(f"{prefix}*.parquet")
+        
+        # Contract ID is everything after the instrument prefix
+        prefix_len = len(prefix)
+        contracts = sorted(
+            file.stem[prefix_len:] for file in files if file.stem.startswith(prefix)
+        )
+        self._contracts_cache[instrument_code] = (mtime, contracts)
+        return list(contracts)
+    
+    def consolidate_contracts(
+        self,
+        instrument_code: str,
+        compression: str = DEFAULT_COMPRESSION,
+        compression_level: Optional[int] = DEFAULT_COMPRESSION_LEVEL
+    ) -> int:
+        """
+        Rewrite all contract files of an instrument into a single parquet file.
         
-        contracts = []
-        for file in files:
-            # Extract contract ID from filename
-            parts = file.stem.split("_")
-            if len(parts) >= 2:
-                contract_id = "_".join(parts[1:])
-                contracts.append(contract_id)
+        Each contract becomes its own row group, tagged with a dictionary-encoded
+        contract_id column, so bulk reads open one file and parse one footer.
+        The per-contract files are left in place.
         
-        return sorted(contracts)
+        Args:
+            instrument_code: Instrument identifier
+            compression: Parquet compression method
+            compression_level: Codec-specific compression level
+            
+        Returns:
+            Number of contracts written
+        """
+        contract_ids = self.list_contracts(instrument_code)
+        if not contract_ids:
+            logger.warning(f"No contracts to consolidate for {instrument_code}")
+            return 0
+        
+        filepath = self.consolidated_prices_path / f"{instrument_code}_contracts.parquet"
+        if compression_level is not None and not pa.Codec.supports_compression_level(compression):
+            compression_level = None
+        
+        sources = [
+            self.contract_prices_path / f"{instrument_code}_{contract_id}.parquet"
+            for contract_id in contract_ids
+        ]
+        
+        writer = None
+        try:
+            # Older files store DOUBLE prices and volume may be INT32 or not, so
+            # columns whose type differs between files are written as DOUBLE
+            schemas = [pq.read_schema(source) for source in sources]
+            target = schemas[0]
+            for schema in schemas[1:]:
+                for index, field in enumerate(target):
+                    if field.type != schema.field(field.name).type:
+                        target = target.set(index, pa.field(field.name, pa.float64()))
+            
+            for contract_id, source in zip(contract_ids, sources):
+                table = pq.read_table(source)
+                if table.schema.remove_metadata() != target.remove_metadata():
+                    table = table.cast(target.with_metadata(table.schema.metadata))
+                contract_column = pa.array([contract_id] * table.num_rows, type=pa.string())
+                table = table.append_column("contract_id", contract_column)
+                
+                if writer is None:
+                    writer = pq.ParquetWriter(
+                        filepath,
+                        table.schema,
+                        compression=compression,
+                        compression_level=compression_level,
+                        use_dictionary=["contract_id"],
+                        write_statistics=True
+                    )
+                
+                writer.write_table(table, row_group_size=max(table.num_rows, 1))
+            
+        except Exception as e:
+            logger.error(f"Error consolidating contracts for {instrument_code}: {e}")
+            raise
+            
+        finally:
+            if writer is not None:
+                writer.close()
+        
+        logger.debug(f"Consolidated {len(contract_ids)} contracts into {filepath}")
+        return len(contract_ids)
+    
+    def read_contracts_consolidated(
+        self,
+        instrument_code: str,
+        contract_ids: Optional[List[str]] = None,
+        columns: Optional[List[str]] = None
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Read contracts from the consolidated file written by consolidate_contracts.
+        
+        Args:
+            instrument_code: Instrument identifier
+            contract_ids: Optional contracts to load; row groups for other
+                contracts are skipped using their statistics
+            columns: Optional subset of price columns to load
+            
+        Returns:
+            Dictionary mapping contract_id to OHLCV DataFrame
+        """
+        filepath = self.consolidated_prices_path / f"{instrument_code}_contracts.parquet"
+        
+        if not filepath.exists():
+            logger.warning(f"Consolidated contract prices file not found: {filepath}")
+            return {}
+        
+        filters = None
+        if contract_ids is not None:
+            filters = [("contract_id", "in", list(contract_ids))]
+        if columns is not None:
+            columns = list(columns) + ["contract_id"]
+        
+        try:
+            data = pd.read_parquet(
+                filepath, engine="pyarrow", columns=columns, filters=filters
+            )
+            
+        except Exception as e:
+            logger.error(f"Error reading consolidated contract prices from {filepath}: {e}")
+            return {}
+        
+        contracts = {
+            str(contract_id): frame.drop(columns="contract_id")
+            for contract_id, frame in data.groupby("contract_id", sort=False, observed=True)
+        }
+        
+        logger.debug(f"Read {len(data)} rows across {len(contracts)} contracts from {filepath}")
+        return contracts
     
     # Multiple Prices Storage
     
@@ -165,7 +569,9 @@ class ParquetStorage:
         self,
         instrument_code: str,
         data: pd.DataFrame,
-        compression: str = "snappy"
+        compression: str = DEFAULT_COMPRESSION,
+        compression_level: Optional[int] = DEFAULT_COMPRESSION_LEVEL,
+        presanitized: bool = False
     ) -> None:
         """
         Store multiple prices (current/forward/carry) data.
@@ -174,6 +580,8 @@ class ParquetStorage:
             instrument_code: Instrument identifier
             data: Multiple prices DataFrame
             compression: Parquet compression method
+            compression_level: Codec-specific compression level
+            presanitized: Skip validation when the caller guarantees the format
         """
         if data.empty:
             logger.warning(f"Empty multiple prices data for {instrument_code}, not writing")
@@ -181,23 +589,21 @@ class ParquetStorage:
         
         try:
             # Validate multiple prices format
-            data = self._validate_multiple_prices_data(data)
+            if not presanitized:
+                data = self._validate_multiple_prices_data(data)
             
             filename = f"{instrument_code}_multiple.parquet"
             filepath = self.multiple_prices_path / filename
             
-            # Add metadata
-            data.attrs["instrument_code"] = instrument_code
-            data.attrs["data_type"] = "multiple_prices"
-            data.attrs["last_updated"] = datetime.now().isoformat()
+            # Metadata is stored in the parquet footer
+            metadata = {
+                "instrument_code": instrument_code,
+                "data_type": "multiple_prices",
+                "last_updated": _now_iso()
+            }
             
             # Write to parquet
-            data.to_parquet(
-                filepath,
-                compression=compression,
-                index=True,
-                engine="pyarrow"
-            )
+            self._write_table(data, filepath, compression, compression_level, metadata)
             
             logger.debug(f"Wrote {len(data)} rows of multiple prices to {filepath}")
             
@@ -205,12 +611,17 @@ class ParquetStorage:
             logger.error(f"Error writing multiple prices for {instrument_code}: {e}")
             raise
     
-    def read_multiple_prices(self, instrument_code: str) -> pd.DataFrame:
+    def read_multiple_prices(
+        self,
+        instrument_code: str,
+        columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
         """
         Read multiple prices data for an instrument.
         
         Args:
             instrument_code: Instrument identifier
+            columns: Optional subset of columns to load (e.g. ['PRICE', 'CARRY'])
             
         Returns:
             Multiple prices DataFrame
@@ -223,7 +634,7 @@ class ParquetStorage:
             return pd.DataFrame()
         
         try:
-            data = pd.read_parquet(filepath, engine="pyarrow")
+            data = pd.read_parquet(filepath, engine="pyarrow", columns=columns)
             logger.debug(f"Read {len(data)} rows of multiple prices from {filepath}")
             return data
             
@@ -237,7 +648,9 @@ class ParquetStorage:
         self,
         instrument_code: str,
         data: pd.DataFrame,
-        compression: str = "snappy"
+        compression: str = DEFAULT_COMPRESSION,
+        compression_level: Optional[int] = DEFAULT_COMPRESSION_LEVEL,
+        presanitized: bool = False
     ) -> None:
         """
         Store back-adjusted continuous price series.
@@ -246,6 +659,8 @@ class ParquetStorage:
             instrument_code: Instrument identifier
             data: Adjusted prices DataFrame
             compression: Parquet compression method
+            compression_level: Codec-specific compression level
+            presanitized: Skip validation when the caller guarantees the format
         """
         if data.empty:
             logger.warning(f"Empty adjusted prices data for {instrument_code}, not writing")
@@ -253,23 +668,21 @@ class ParquetStorage:
         
         try:
             # Validate adjusted prices format
-            data = self._validate_adjusted_prices_data(data)
+            if not presanitized:
+                data = self._validate_adjusted_prices_data(data)
             
             filename = f"{instrument_code}_adjusted.parquet"
             filepath = self.adjusted_prices_path / filename
             
-            # Add metadata
-            data.attrs["instrument_code"] = instrument_code
-            data.attrs["data_type"] = "adjusted_prices"
-            data.attrs["last_updated"] = datetime.now().isoformat()
+            # Metadata is stored in the parquet footer
+            metadata = {
+                "instrument_code": instrument_code,
+                "data_type": "adjusted_prices",
+                "last_updated": _now_iso()
+            }
             
             # Write to parquet
-            data.to_parquet(
-                filepath,
-                compression=compression,
-                index=True,
-                engine="pyarrow"
-            )
+            self._write_table(data, filepath, compression, compression_level, metadata)
             
             logger.debug(f"Wrote {len(data)} rows of adjusted prices to {filepath}")
             
@@ -277,12 +690,17 @@ class ParquetStorage:
             logger.error(f"Error writing adjusted prices for {instrument_code}: {e}")
             raise
     
-    def read_adjusted_prices(self, instrument_code: str) -> pd.DataFrame:
+    def read_adjusted_prices(
+        self,
+        instrument_code: str,
+        columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
         """
         Read back-adjusted continuous price series.
         
         Args:
             instrument_code: Instrument identifier
+            columns: Optional subset of columns to load
             
         Returns:
             Adjusted prices DataFrame
@@ -295,7 +713,7 @@ class ParquetStorage:
             return pd.DataFrame()
         
         try:
-            data = pd.read_parquet(filepath, engine="pyarrow")
+            data = pd.read_parquet(filepath, engine="pyarrow", columns=columns)
             logger.debug(f"Read {len(data)} rows of adjusted prices from {filepath}")
             return data
             
@@ -303,7 +721,7 @@ class ParquetStorage:
             logger.error(f"Error reading adjusted prices from {filepath}: {e}")
             return pd.DataFrame()
     
-    # Roll Calendar Storage (CSV format for human readability)
+    # Roll Calendar Storage (parquet for reads, CSV for human readability)
     
     def write_roll_calendar(
         self,
@@ -311,7 +729,7 @@ class ParquetStorage:
         roll_calendar: pd.DataFrame
     ) -> None:
         """
-        Store roll calendar in CSV format.
+        Store roll calendar in parquet format, plus a CSV copy for inspection.
         
         Args:
             instrument_code: Instrument identifier
@@ -328,6 +746,12 @@ class ParquetStorage:
             # Write to CSV with proper formatting
             roll_calendar.to_csv(filepath, index=True, date_format="%Y-%m-%d")
             
+            # Parquet copy used by read_roll_calendar
+            parquet_path = self.roll_calendars_path / f"{instrument_code}_roll_calendar.parquet"
+            self._write_table(
+                roll_calendar, parquet_path, DEFAULT_COMPRESSION, DEFAULT_COMPRESSION_LEVEL
+            )
+            
             logger.debug(f"Wrote {len(roll_calendar)} roll dates to {filepath}")
             
         except Exception as e:
@@ -344,6 +768,17 @@ class ParquetStorage:
         Returns:
             Roll calendar DataFrame
         """
+        parquet_path = self.roll_calendars_path / f"{instrument_code}_roll_calendar.parquet"
+        if parquet_path.exists():
+            try:
+                data = pd.read_parquet(parquet_path, engine="pyarrow")
+                logger.debug(f"Read {len(data)} roll dates from {parquet_path}")
+                return data
+                
+            except Exception as e:
+                logger.warning(f"Error reading roll calendar from {parquet_path}, trying CSV: {e}")
+        
+        # Fall back to the CSV file (calendars written before the parquet copy)
         filename = f"{instrument_code}_roll_calendar.csv"
         filepath = self.roll_calendars_path / filename
         
@@ -352,7 +787,9 @@ class ParquetStorage:
             return pd.DataFrame()
         
         try:
-            data = pd.read_csv(filepath, index_col=0, parse_dates=True)
+            data = pd.read_csv(filepath, index_col=0)
+            # Explicit format avoids per-value date format inference
+            data.index = pd.to_datetime(data.index, format="%Y-%m-%d")
             logger.debug(f"Read {len(data)} roll dates from {filepath}")
             return data
             
@@ -363,15 +800,26 @@ class ParquetStorage:
     # Utility Methods
     
     def get_existing_instruments(self) -> List[str]:
-        """Get list of all instruments with data."""
-        instruments = set()
+        """
+        Get list of all instruments with data.
         
-        # Check adjusted prices (most comprehensive indicator)
-        for file in self.adjusted_prices_path.glob("*_adjusted.parquet"):
-            instrument_code = file.stem.replace("_adjusted", "")
-            instruments.add(instrument_code)
+        The listing is cached until the adjusted_prices directory changes.
+        """
+        mtime = self.adjusted_prices_path.stat().st_mtime_ns
+        cached = self._instruments_cache
+        if cached is not None and cached[0] == mtime:
+            return list(cached[1])
         
-        return sorted(list(instruments))
+        # Check adjusted prices (most comprehensive indicator)
+        suffix = "_adjusted.parquet"
+        suffix_len = len(suffix)
+        with os.scandir(self.adjusted_prices_path) as it:
+            instruments = sorted(
+                entry.name[:-suffix_len] for entry in it
+                if entry.name.endswith(suffix) and entry.is_file(follow_symlinks=False)
+            )
+        self._instruments_cache = (mtime, instruments)
+        return list(instruments)
     
     def get_data_summary(self, instrument_code: str) -> Dict[str, Any]:
         """Get summary information about stored data for an instrument."""
@@ -386,30 +834,41 @@ class ParquetStorage:
         }
         
         try:
+            # The reads are independent, so issue them concurrently
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                adjusted_future = executor.submit(self.read_adjusted_prices, instrument_code)
+                multiple_future = executor.submit(self.read_multiple_prices, instrument_code)
+                roll_future = executor.submit(self.read_roll_calendar, instrument_code)
+                contracts_future = executor.submit(self.list_contracts, instrument_code)
+            
             # Check adjusted prices
-            adjusted_data = self.read_adjusted_prices(instrument_code)
+            adjusted_data = adjusted_future.result()
             if not adjusted_data.empty:
                 summary["has_adjusted_prices"] = True
                 summary["date_range"] = (adjusted_data.index.min(), adjusted_data.index.max())
             
             # Check multiple prices
-            multiple_data = self.read_multiple_prices(instrument_code)
+            multiple_data = multiple_future.result()
             summary["has_multiple_prices"] = not multiple_data.empty
             
             # Check roll calendar
-            roll_calendar = self.read_roll_calendar(instrument_code)
+            roll_calendar = roll_future.result()
             summary["has_roll_calendar"] = not roll_calendar.empty
             
             # Count contracts
-            contracts = self.list_contracts(instrument_code)
+            contracts = contracts_future.result()
             summary["contract_count"] = len(contracts)
             
             # Get last update time from adjusted prices metadata
             if summary["has_adjusted_prices"]:
                 filepath = self.adjusted_prices_path / f"{instrument_code}_adjusted.parquet"
                 if filepath.exists():
-                    stat = filepath.stat()
-                    summary["last_updated"] = datetime.fromtimestamp(stat.st_mtime)
+                    last_updated = self.read_file_metadata(filepath).get("last_updated")
+                    if last_updated is not None:
+                        summary["last_updated"] = datetime.fromisoformat(last_updated)
+                    else:
+                        # Files written before metadata was stored in the footer
+                        summary["last_updated"] = datetime.fromtimestamp(filepath.stat().st_mtime)
             
         except Exception as e:
             logger.error(f"Error getting data summary for {instrument_code}: {e}")
@@ -434,21 +893,16 @@ class ParquetStorage:
         if missing_columns:
             raise ValueError(f"Missing required columns: {missing_columns}")
         
-        # Ensure numeric data
+        # Ensure numeric data, skipping columns that already have a numeric dtype
         for col in required_columns + ["VOLUME"]:
-            if col in data.columns:
+            if col in data.columns and not pd.api.types.is_numeric_dtype(data[col]):
                 data[col] = pd.to_numeric(data[col], errors="coerce")
         
-        # Basic validation
-        if (data["HIGH"] < data["LOW"]).any():
-            logger.warning("Found HIGH < LOW, fixing...")
-            # Swap HIGH and LOW where necessary
-            mask = data["HIGH"] < data["LOW"]
-            data.loc[mask, ["HIGH", "LOW"]] = data.loc[mask, ["LOW", "HIGH"]].values
-        
-        # Ensure OHLC consistency
-        data["HIGH"] = data[["OPEN", "HIGH", "LOW", "CLOSE"]].max(axis=1)
-        data["LOW"] = data[["OPEN", "HIGH", "LOW", "CLOSE"]].min(axis=1)
+        # Ensure OHLC consistency (fmax/fmin skip NaNs like DataFrame.max/min).
+        # Taking the row max/min over all four prices also repairs HIGH < LOW.
+        ohlc = data[required_columns].to_numpy()
+        data["HIGH"] = np.fmax.reduce(ohlc, axis=1)
+        data["LOW"] = np.fmin.reduce(ohlc, axis=1)
         
         return data
     
@@ -488,9 +942,15 @@ class ParquetStorage:
                 multiple_file.unlink()
             
             # Delete roll calendar
-            roll_file = self.roll_calendars_path / f"{instrument_code}_roll_calendar.csv"
-            if roll_file.exists():
-                roll_file.unlink()
+            for suffix in ("csv", "parquet"):
+                roll_file = self.roll_calendars_path / f"{instrument_code}_roll_calendar.{suffix}"
+                if roll_file.exists():
+                    roll_file.unlink()
+            
+            # Delete consolidated contract prices
+            consolidated_file = self.consolidated_prices_path / f"{instrument_code}_contracts.parquet"
+            if consolidated_file.exists():
+                consolidated_file.unlink()
             
             # Delete contract prices
             contracts = self.list_contracts(instrument_code)
@@ -516,24 +976,51 @@ class ParquetStorage:
         
         type_paths = {
             "contract_prices": self.contract_prices_path,
+            "consolidated_prices": self.consolidated_prices_path,
             "multiple_prices": self.multiple_prices_path,
             "adjusted_prices": self.adjusted_prices_path,
             "roll_calendars": self.roll_calendars_path,
             "fx_data": self.fx_data_path
         }
         
-        for data_type, path in type_paths.items():
-            if path.exists():
-                files = list(path.glob("*"))
-                file_count = len(files)
-                total_size = sum(f.stat().st_size for f in files if f.is_file())
-                
-                stats["by_type"][data_type] = {
-                    "file_count": file_count,
-                    "size_mb": total_size / (1024 * 1024)
-                }
-                
-                stats["total_files"] += file_count
-                stats["total_size_mb"] += total_size / (1024 * 1024)
+        existing_paths = {
+            data_type: path for data_type, path in type_paths.items() if path.exists()
+        }
         
-        return stats
\ No newline at end of file
+        # The directory scans are independent, so run them concurrently
+        with ThreadPoolExecutor(max_workers=len(existing_paths) or 1) as executor:
+            scan_results = dict(zip(
+                existing_paths,
+                executor.map(self._scandir_stats, existing_paths.values())
+            ))
+        
+        for data_type, (file_count, total_size) in scan_results.items():
+            stats["by_type"][data_type] = {
+                "file_count": file_count,
+                "size_mb": total_size / (1024 * 1024)
+            }
+            
+            stats["total_files"] += file_count
+            stats["total_size_mb"] += total_size / (1024 * 1024)
+        
+        return stats
+    
+    @staticmethod
+    def _scandir_stats(path: Union[str, Path]) -> Tuple[int, int]:
+        """
+        Count regular files in a directory and sum their sizes.
+        
+        Uses os.scandir so file type checks come from the directory read
+        rather than an extra stat call per entry.
+        
+        Returns:
+            Tuple of (file_count, total_size_bytes)
+        """
+        file_count = 0
+        total_size = 0
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_file(follow_symlinks=False):
+                    file_count += 1
+                    total_size += entry.stat(follow_symlinks=False).st_size
+        return file_count, total_size
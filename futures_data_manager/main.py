@@ -11,7 +11,7 @@ from datetime import datetime, timedelta
 import pandas as pd
 from loguru import logger
 
-from futures_data_manager.config.instruments import InstrumentConfig
+from futures_data_manager.config.instruments import get_default_config
 from futures_data_manager.data_sources.interactive_brokers import IBDataSource
 from futures_data_manager.data_storage.parquet_storage import ParquetStorage
 from futures_data_manager.roll_calendars.roll_calendar_generator import RollCalendarGenerator
@@ -67,7 +67,7 @@ class FuturesDataManager:
         logger.add(lambda msg: print(msg), level=log_level)
         
         # Initialize components
-        self.instrument_config = InstrumentConfig()
+        self.instrument_config = get_default_config()
         self.ib_source = IBDataSource(ib_host, ib_port, ib_client_id)
         self.storage = ParquetStorage(data_path)
         self.roll_calendar_generator = RollCalendarGenerator()
@@ -195,11 +195,16 @@ class FuturesDataManager:
         contracts = self._get_contract_list(instrument_code, config, start_date, end_date)
         contract_prices = {}
         
+        # Load all stored contracts in one scan rather than one read per contract
+        existing_contracts = (
+            self.storage.read_all_contracts(instrument_code) if update_mode else {}
+        )
+        
         for contract_id in contracts:
             try:
                 # Check if we already have this data and in update mode
-                if update_mode and self.storage.contract_exists(instrument_code, contract_id):
-                    existing_data = self.storage.read_contract_prices(instrument_code, contract_id)
+                existing_data = existing_contracts.get(contract_id)
+                if existing_data is not None:
                     if not existing_data.empty:
                         # Get only recent data to append
                         last_date = existing_data.index[-1]
@@ -330,9 +335,11 @@ class FuturesDataManager:
     ) -> None:
         """Store all processed data for an instrument."""
         
-        # Store individual contract prices
+        # Store individual contract prices (already sanitized by the IB data source)
         for contract_id, prices in contract_prices.items():
-            self.storage.write_contract_prices(instrument_code, contract_id, prices)
+            self.storage.write_contract_prices(
+                instrument_code, contract_id, prices, presanitized=True
+            )
         
         # Store multiple prices
         self.storage.write_multiple_prices(instrument_code, multiple_prices)
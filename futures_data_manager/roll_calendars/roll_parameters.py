@@ -4,7 +4,7 @@ Defines roll cycles, offsets, and other rolling parameters.
 """
 
 from typing import Dict, Any, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from futures_data_manager.config.instruments import AssetClass
 
 
@@ -39,8 +39,8 @@ class RollParameters:
         if self.roll_offset_days > 0:
             raise ValueError("roll_offset_days should be negative (roll before expiry)")
         
-        if abs(self.roll_offset_days) > 365:
-            raise ValueError("roll_offset_days magnitude should be less than 365")
+        if abs(self.roll_offset_days) > 2000:
+            raise ValueError("roll_offset_days magnitude should be at most 2000")  # STIR rolls very early
         
         if abs(self.carry_offset) > 12:
             raise ValueError("carry_offset should be between -12 and 12")
@@ -140,6 +140,33 @@ class DefaultRollParameters:
         return cls.PARAMETERS.copy()
 
 
+# Special cases and customizations
+_INSTRUMENT_CUSTOMIZATIONS = {
+    "EDOLLAR": RollParameters(
+        hold_cycle="HMUZ",
+        priced_cycle="FGHJKMNQUVXZ",
+        roll_offset_days=-1000,  # Very early roll for STIR
+        expiry_offset=0,
+        carry_offset=-1
+    ),
+    "VIX": RollParameters(
+        hold_cycle="FGHJKMNQUVXZ",
+        priced_cycle="FGHJKMNQUVXZ", 
+        roll_offset_days=-30,  # Roll 30 days before expiry
+        expiry_offset=0,
+        carry_offset=-1
+    ),
+    "V2X": RollParameters(
+        hold_cycle="FGHJKMNQUVXZ",
+        priced_cycle="FGHJKMNQUVXZ",
+        roll_offset_days=-30,
+        expiry_offset=0,
+        carry_offset=-1
+    ),
+    # Add more customizations as needed
+}
+
+
 def get_roll_parameters_for_instrument(instrument_code: str, asset_class: AssetClass) -> RollParameters:
     """
     Get roll parameters for a specific instrument, with customizations for special cases.
@@ -151,39 +178,12 @@ def get_roll_parameters_for_instrument(instrument_code: str, asset_class: AssetC
     Returns:
         RollParameters for the instrument
     """
-    # Start with default parameters for asset class
-    params = DefaultRollParameters.get_parameters(asset_class)
-    
-    # Special cases and customizations
-    customizations = {
-        "EDOLLAR": RollParameters(
-            hold_cycle="HMUZ",
-            priced_cycle="FGHJKMNQUVXZ",
-            roll_offset_days=-1000,  # Very early roll for STIR
-            expiry_offset=0,
-            carry_offset=-1
-        ),
-        "VIX": RollParameters(
-            hold_cycle="FGHJKMNQUVXZ",
-            priced_cycle="FGHJKMNQUVXZ", 
-            roll_offset_days=-30,  # Roll 30 days before expiry
-            expiry_offset=0,
-            carry_offset=-1
-        ),
-        "V2X": RollParameters(
-            hold_cycle="FGHJKMNQUVXZ",
-            priced_cycle="FGHJKMNQUVXZ",
-            roll_offset_days=-30,
-            expiry_offset=0,
-            carry_offset=-1
-        ),
-        # Add more customizations as needed
-    }
-    
-    if instrument_code in customizations:
-        return customizations[instrument_code]
+    if instrument_code in _INSTRUMENT_CUSTOMIZATIONS:
+        # Hand out a copy so callers cannot modify the shared table
+        return replace(_INSTRUMENT_CUSTOMIZATIONS[instrument_code])
     
-    return params
+    # Fall back to default parameters for asset class
+    return DefaultRollParameters.get_parameters(asset_class)
 
 
 def validate_roll_calendar_consistency(
@@ -31,6 +31,8 @@ from futures_data_manager.utils.logging_utils import (
     LoggerMixin
 )
 
+from futures_data_manager.utils.dataclass_utils import slotted_dataclass
+
 __all__ = [
     # Date utilities
     "get_business_days_between",
@@ -56,5 +58,8 @@ __all__ = [
     "log_exceptions",
     "setup_file_logging",
     "get_performance_logger",
-    "LoggerMixin"
+    "LoggerMixin",
+    
+    # Dataclass utilities
+    "slotted_dataclass"
 ]
\ No newline at end of file
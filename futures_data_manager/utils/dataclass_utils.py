@@ -0,0 +1,50 @@
+"""
+Dataclass helpers shared by the configuration and data object modules.
+"""
+
+import sys
+from dataclasses import dataclass, fields
+
+
+def slotted_dataclass(cls=None, *, frozen: bool = False):
+    """
+    Apply dataclass(slots=True), backporting slots before Python 3.10.
+    
+    On older interpreters the dataclass is rebuilt with __slots__ the same way
+    the standard library does it. Frozen classes also get the pickle hooks a
+    frozen slotted class needs because unpickling cannot go through the
+    frozen __setattr__.
+    
+    Args:
+        cls: Class to decorate
+        frozen: Make instances immutable, as with dataclass(frozen=True)
+    """
+    def wrap(cls):
+        if sys.version_info >= (3, 10):
+            return dataclass(frozen=frozen, slots=True)(cls)
+        
+        cls = dataclass(frozen=frozen)(cls)
+        field_names = tuple(f.name for f in fields(cls))
+        
+        cls_dict = dict(cls.__dict__)
+        cls_dict['__slots__'] = field_names
+        for name in field_names + ('__dict__', '__weakref__'):
+            # Field defaults live on the class and would clash with the slot descriptors
+            cls_dict.pop(name, None)
+        
+        if frozen:
+            def __getstate__(self):
+                return [getattr(self, name) for name in field_names]
+            
+            def __setstate__(self, state):
+                for name, value in zip(field_names, state):
+                    object.__setattr__(self, name, value)
+            
+            cls_dict['__getstate__'] = __getstate__
+            cls_dict['__setstate__'] = __setstate__
+        
+        slotted = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+        slotted.__qualname__ = cls.__qualname__
+        return slotted
+    
+    return wrap if cls is None else wrap(cls)
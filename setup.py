@@ -79,6 +79,7 @@ setup(
         "futures_data_manager": [
             "config/*.csv",
             "config/*.json", 
+            "config/*.pkl",
         ],
     },
     include_package_data=True,